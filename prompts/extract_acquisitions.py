@@ -1,3 +1,6 @@
+import hashlib
+import re
+
 SYSTEM_PROMPT = """\
 You are a Guild Wars 2 wiki data extractor. Given an item's API metadata and its \
 rendered wiki page HTML, extract all acquisition sources into structured JSON entries. \
@@ -28,7 +31,8 @@ Only include for recipe and vendor entries. Omit entirely for other section type
 
 ## Wiki Section Tags
 
-Tag each entry with the wiki section it was found in using these exact values:
+Tag each entry with the wiki section it was found in using these exact values. Worked \
+examples for the sections present on a page are included in the User message.
 
 ### wikiSection: "recipe"
 For entries found in recipe boxes (`<div class="recipe-box">`) or crafting tables.
@@ -49,41 +53,6 @@ they always produce output, just in variable quantities. Include with high confi
 However, recipes with "rare chance", "possible output", or probabilistic language are NOT \
 deterministic — give these confidence < 0.5.
 
-**Example input** (recipe box HTML):
-```html
-<div class="recipe-box">
-  <div class="heading">Obsidian Shard</div>
-  <div class="wrapper"><dl>
-    <dt>Source</dt><dd><a href="/wiki/Mystic_Forge">Mystic Forge</a></dd>
-    <dt>Output qty.</dt><dd><span title="...varies...">3 – 15</span></dd>
-  </dl></div>
-  <div class="subheading">Ingredients</div>
-  <div class="ingredients"><dl>
-    <dt>1</dt><dd>...<a class="mw-selflink selflink">Obsidian Shard</a></dd>
-    <dt>1</dt><dd>...<a href="/wiki/Mystic_Coin">Mystic Coin</a></dd>
-    <dt>1</dt><dd>...<a href="/wiki/Pile_of_Putrid_Essence">Pile of Putrid Essence</a></dd>
-    <dt>1</dt><dd>...<a href="/wiki/Mini_Risen_Priest_of_Balthazar">Mini Risen Priest of Balthazar</a></dd>
-  </dl></div>
-</div>
-```
-**Example output:**
-{
-  "name": "Obsidian Shard",
-  "wikiSection": "recipe",
-  "wikiSubsection": "mystic_forge",
-  "confidence": 0.4,
-  "quantity": 3,
-  "quantityMin": 3,
-  "quantityMax": 15,
-  "ingredients": [
-    {"name": "Obsidian Shard", "quantity": 1},
-    {"name": "Mystic Coin", "quantity": 1},
-    {"name": "Pile of Putrid Essence", "quantity": 1},
-    {"name": "Mini Risen Priest of Balthazar", "quantity": 1}
-  ]
-}
-Note: Low confidence because the wiki page notes this has a ~12% chance to produce Obsidian Shards.
-
 ### wikiSection: "vendor"
 For entries found in "Sold by" vendor tables (`<table class="npc sortable table">`).
 - Create a SEPARATE entry for EACH vendor row/NPC
@@ -98,42 +67,6 @@ For entries found in "Sold by" vendor tables (`<table class="npc sortable table"
 Gold costs: use name "Coin" with quantity in copper. The wiki `data-sort-value` attribute \
 gives the total in copper. For example `data-sort-value="96"` means 96 copper.
 
-**Example input** (vendor table row with multi-currency cost and notes):
-```html
-<tr>
-  <td><a href="/wiki/Exalted_Mastery_Vendor">Exalted Mastery Vendor</a></td>
-  <td>...</td><td>...</td>
-  <td>25&nbsp;<a href="/wiki/Lump_of_Aurillium">Lump of Aurillium</a>&nbsp;+&nbsp;\
-1,050&nbsp;<a href="/wiki/Karma">Karma</a></td>
-  <td>Requires the mastery <a href="/wiki/Exalted_Acceptance">Exalted Acceptance</a>.</td>
-</tr>
-```
-**Example output:**
-{
-  "name": "Exalted Mastery Vendor",
-  "wikiSection": "vendor",
-  "confidence": 1.0,
-  "quantity": 1,
-  "ingredients": [
-    {"name": "Lump of Aurillium", "quantity": 25},
-    {"name": "Karma", "quantity": 1050}
-  ],
-  "metadata": {"notes": "Requires the mastery Exalted Acceptance"}
-}
-
-**Example input** (batch vendor: "5 for 1 Guild Commendation"):
-```html
-<td>5&nbsp;for&nbsp;1&nbsp;<a href="/wiki/Guild_Commendation">Guild Commendation</a></td>
-```
-**Example output:**
-{
-  "name": "Guild Commendation Trader",
-  "wikiSection": "vendor",
-  "confidence": 1.0,
-  "quantity": 5,
-  "ingredients": [{"name": "Guild Commendation", "quantity": 1}]
-}
-
 ### wikiSection: "achievement"
 For entries found in collection achievement sections or achievement reward boxes.
 - name: the achievement name
@@ -161,26 +94,6 @@ For variable quantities shown as parenthetical (e.g., `(1-3)`, `(2, 8)`):
 
 Only include entries where guaranteed=true or choice=true. Skip chance-only drops.
 
-**Example input:**
-```html
-<h3><span id="Gathered_from">Gathered from</span></h3>
-<ul class="smw-format ul-format">
-  <li class="smw-row"><span><a href="/wiki/Mistborn_Coffer">Mistborn Coffer</a> \
-(3) </span></li>
-  <li class="smw-row"><span><a href="/wiki/Buried_Locked_Chest">Buried Locked Chest</a> \
-(1-5) <small>(chance)</small></span></li>
-  <li class="smw-row"><span><a href="/wiki/Rich_Iron_Vein">Rich Iron Vein</a> \
-(1-3) </span></li>
-</ul>
-```
-**Example output** (Buried Locked Chest skipped because it's chance):
-[
-  {"name": "Mistborn Coffer", "wikiSection": "gathered_from", "confidence": 1.0, \
-"quantity": 3, "guaranteed": true, "metadata": {}},
-  {"name": "Rich Iron Vein", "wikiSection": "gathered_from", "confidence": 1.0, \
-"quantity": 1, "quantityMin": 1, "quantityMax": 3, "guaranteed": true, "metadata": {}}
-]
-
 ### wikiSection: "contained_in"
 For entries found in "Contained in" sections. These can use EITHER h4 sub-headings OR \
 inline `<small>` tags to indicate guaranteed/chance/choice status.
@@ -210,40 +123,6 @@ choice=true even if guaranteed=false.
 
 Only include entries where guaranteed=true OR choice=true. Skip chance-only drops.
 
-**Example input (h4 pattern):**
-```html
-<h3><span id="Contained_in">Contained in</span></h3>
-<h4><span id="Guaranteed">Guaranteed</span></h4>
-<ul class="smw-format ul-format">
-  <li class="smw-row">...<a href="/wiki/Bag_of_Obsidian">Bag of Obsidian</a> (3) </li>
-</ul>
-<h4><span id="Chance">Chance</span></h4>
-<ul class="smw-format ul-format">
-  <li class="smw-row">...<a href="/wiki/Buried_Treasure">Buried Treasure</a> (1, 3) </li>
-</ul>
-```
-**Example output:**
-[
-  {"name": "Bag of Obsidian", "wikiSection": "contained_in", \
-"wikiSubsection": "guaranteed", "confidence": 1.0, "quantity": 3, "metadata": {}}
-]
-
-**Example input (inline pattern):**
-```html
-<h3><span id="Contained_in">Contained in</span></h3>
-<ul class="smw-format ul-format">
-  <li class="smw-row">...<a href="/wiki/Legendary_Gift_Starter_Kit">\
-Legendary Gift Starter Kit</a> <small>(<b>choice</b>)</small></li>
-  <li class="smw-row">...<a href="/wiki/Random_Box">Random Box</a> \
-<small>(chance)</small></li>
-</ul>
-```
-**Example output** (Random Box skipped because it's chance):
-[
-  {"name": "Legendary Gift Starter Kit", "wikiSection": "contained_in", \
-"wikiSubsection": "inline", "confidence": 1.0, "quantity": 1, "choice": true, "metadata": {}}
-]
-
 ### wikiSection: "salvaged_from"
 For entries found in "Salvaged from" sections.
 - name: the source item name
@@ -262,25 +141,6 @@ For entries found in "Reward tracks" sections.
 - No ingredients field
 - quantity: total quantity received across the track (sum all tier rewards)
 
-**Example input:**
-```html
-<h3><span id="Reward_tracks">Reward tracks</span></h3>
-<span class="inline-icon"><a href="/wiki/Gift_of_Battle_Item_Reward_Track">\
-Gift of Battle Item Reward Track</a></span> <small>– WvW only</small>
-<table><tbody>
-  <tr><td>Tier 1,</td><td>5th reward.</td><td>5th of 40.</td><td>(4)</td></tr>
-  <tr><td>Tier 4,</td><td>5th reward.</td><td>20th of 40.</td><td>(4)</td></tr>
-</tbody></table>
-```
-**Example output:**
-{
-  "name": "Gift of Battle Item Reward Track",
-  "wikiSection": "reward_track",
-  "wikiSubsection": "wvw",
-  "confidence": 0.9,
-  "quantity": 8
-}
-
 ### wikiSection: "map_reward"
 For entries found in map/world/region completion sections.
 - name: description of the reward source
@@ -364,17 +224,9 @@ intermediate steps. Each rarity variant is processed as a separate item — the
 file should NOT contain Ascended vendor entries.
 
 **Vendor table filtering:**
-Determine each vendor row's rarity:
-- If the table has a Rarity column, read it from the `<span class="rarity-{rarity}">` marker.
-- If the table has NO Rarity column, assume every row is Ascended.
-
-ONLY include rows whose rarity EXACTLY matches the User-provided rarity. \
-If ZERO rows match, emit ZERO vendor entries — do NOT fall back to other rarities. \
-Do NOT include Ascended vendor rows when the requested rarity is Legendary.
-
-**Example:** The given item rarity is Legendary. The vendor table rows are all marked \
-`rarity-ascended` (or have no Rarity column, which defaults to Ascended). \
-Result: ZERO vendor entries, because Ascended ≠ Legendary.
+Vendor table rows for other rarities have already been removed from the page (tables without a \
+Rarity column are treated as Ascended). Every remaining vendor row applies to the given item. \
+If a multi-rarity page has no vendor rows left, emit ZERO vendor entries.
 
 **Recipe box filtering:**
 Recipe boxes on multi-rarity pages produce a SPECIFIC variant. Check the recipe heading and \
@@ -437,20 +289,273 @@ All other section types have no ingredients — omit the field entirely.
 """
 
 
-def build_user_prompt(
-    item_id: int,
-    name: str,
-    item_type: str,
-    rarity: str,
-    wiki_html: str,
-) -> str:
-    return f"""\
+EXAMPLES: dict[str, str] = {
+    "recipe": """\
+**Example input** (recipe box HTML):
+```html
+<div class="recipe-box">
+  <div class="heading">Obsidian Shard</div>
+  <div class="wrapper"><dl>
+    <dt>Source</dt><dd><a href="/wiki/Mystic_Forge">Mystic Forge</a></dd>
+    <dt>Output qty.</dt><dd><span title="...varies...">3 – 15</span></dd>
+  </dl></div>
+  <div class="subheading">Ingredients</div>
+  <div class="ingredients"><dl>
+    <dt>1</dt><dd>...<a class="mw-selflink selflink">Obsidian Shard</a></dd>
+    <dt>1</dt><dd>...<a href="/wiki/Mystic_Coin">Mystic Coin</a></dd>
+    <dt>1</dt><dd>...<a href="/wiki/Pile_of_Putrid_Essence">Pile of Putrid Essence</a></dd>
+    <dt>1</dt><dd>...<a href="/wiki/Mini_Risen_Priest_of_Balthazar">Mini Risen Priest of Balthazar</a></dd>
+  </dl></div>
+</div>
+```
+**Example output:**
+{
+  "name": "Obsidian Shard",
+  "wikiSection": "recipe",
+  "wikiSubsection": "mystic_forge",
+  "confidence": 0.4,
+  "quantity": 3,
+  "quantityMin": 3,
+  "quantityMax": 15,
+  "ingredients": [
+    {"name": "Obsidian Shard", "quantity": 1},
+    {"name": "Mystic Coin", "quantity": 1},
+    {"name": "Pile of Putrid Essence", "quantity": 1},
+    {"name": "Mini Risen Priest of Balthazar", "quantity": 1}
+  ]
+}
+Note: Low confidence because the wiki page notes this has a ~12% chance to produce Obsidian Shards.
+""",
+    "vendor": """\
+**Example input** (vendor table row with multi-currency cost and notes):
+```html
+<tr>
+  <td><a href="/wiki/Exalted_Mastery_Vendor">Exalted Mastery Vendor</a></td>
+  <td>...</td><td>...</td>
+  <td>25&nbsp;<a href="/wiki/Lump_of_Aurillium">Lump of Aurillium</a>&nbsp;+&nbsp;\
+1,050&nbsp;<a href="/wiki/Karma">Karma</a></td>
+  <td>Requires the mastery <a href="/wiki/Exalted_Acceptance">Exalted Acceptance</a>.</td>
+</tr>
+```
+**Example output:**
+{
+  "name": "Exalted Mastery Vendor",
+  "wikiSection": "vendor",
+  "confidence": 1.0,
+  "quantity": 1,
+  "ingredients": [
+    {"name": "Lump of Aurillium", "quantity": 25},
+    {"name": "Karma", "quantity": 1050}
+  ],
+  "metadata": {"notes": "Requires the mastery Exalted Acceptance"}
+}
+
+**Example input** (batch vendor: "5 for 1 Guild Commendation"):
+```html
+<td>5&nbsp;for&nbsp;1&nbsp;<a href="/wiki/Guild_Commendation">Guild Commendation</a></td>
+```
+**Example output:**
+{
+  "name": "Guild Commendation Trader",
+  "wikiSection": "vendor",
+  "confidence": 1.0,
+  "quantity": 5,
+  "ingredients": [{"name": "Guild Commendation", "quantity": 1}]
+}
+""",
+    "gathered_from": """\
+**Example input:**
+```html
+<h3><span id="Gathered_from">Gathered from</span></h3>
+<ul class="smw-format ul-format">
+  <li class="smw-row"><span><a href="/wiki/Mistborn_Coffer">Mistborn Coffer</a> \
+(3) </span></li>
+  <li class="smw-row"><span><a href="/wiki/Buried_Locked_Chest">Buried Locked Chest</a> \
+(1-5) <small>(chance)</small></span></li>
+  <li class="smw-row"><span><a href="/wiki/Rich_Iron_Vein">Rich Iron Vein</a> \
+(1-3) </span></li>
+</ul>
+```
+**Example output** (Buried Locked Chest skipped because it's chance):
+[
+  {"name": "Mistborn Coffer", "wikiSection": "gathered_from", "confidence": 1.0, \
+"quantity": 3, "guaranteed": true, "metadata": {}},
+  {"name": "Rich Iron Vein", "wikiSection": "gathered_from", "confidence": 1.0, \
+"quantity": 1, "quantityMin": 1, "quantityMax": 3, "guaranteed": true, "metadata": {}}
+]
+""",
+    "contained_in_h4": """\
+**Example input (h4 pattern):**
+```html
+<h3><span id="Contained_in">Contained in</span></h3>
+<h4><span id="Guaranteed">Guaranteed</span></h4>
+<ul class="smw-format ul-format">
+  <li class="smw-row">...<a href="/wiki/Bag_of_Obsidian">Bag of Obsidian</a> (3) </li>
+</ul>
+<h4><span id="Chance">Chance</span></h4>
+<ul class="smw-format ul-format">
+  <li class="smw-row">...<a href="/wiki/Buried_Treasure">Buried Treasure</a> (1, 3) </li>
+</ul>
+```
+**Example output:**
+[
+  {"name": "Bag of Obsidian", "wikiSection": "contained_in", \
+"wikiSubsection": "guaranteed", "confidence": 1.0, "quantity": 3, "metadata": {}}
+]
+""",
+    "contained_in_inline": """\
+**Example input (inline pattern):**
+```html
+<h3><span id="Contained_in">Contained in</span></h3>
+<ul class="smw-format ul-format">
+  <li class="smw-row">...<a href="/wiki/Legendary_Gift_Starter_Kit">\
+Legendary Gift Starter Kit</a> <small>(<b>choice</b>)</small></li>
+  <li class="smw-row">...<a href="/wiki/Random_Box">Random Box</a> \
+<small>(chance)</small></li>
+</ul>
+```
+**Example output** (Random Box skipped because it's chance):
+[
+  {"name": "Legendary Gift Starter Kit", "wikiSection": "contained_in", \
+"wikiSubsection": "inline", "confidence": 1.0, "quantity": 1, "choice": true, "metadata": {}}
+]
+""",
+    "reward_track": """\
+**Example input:**
+```html
+<h3><span id="Reward_tracks">Reward tracks</span></h3>
+<span class="inline-icon"><a href="/wiki/Gift_of_Battle_Item_Reward_Track">\
+Gift of Battle Item Reward Track</a></span> <small>– WvW only</small>
+<table><tbody>
+  <tr><td>Tier 1,</td><td>5th reward.</td><td>5th of 40.</td><td>(4)</td></tr>
+  <tr><td>Tier 4,</td><td>5th reward.</td><td>20th of 40.</td><td>(4)</td></tr>
+</tbody></table>
+```
+**Example output:**
+{
+  "name": "Gift of Battle Item Reward Track",
+  "wikiSection": "reward_track",
+  "wikiSubsection": "wvw",
+  "confidence": 0.9,
+  "quantity": 8
+}
+""",
+}
+
+_EXAMPLE_MARKERS: dict[str, re.Pattern[str]] = {
+    "recipe": re.compile(r'class="recipe-box"'),
+    "vendor": re.compile(r'class="npc\b'),
+    "gathered_from": re.compile(r'id="Gathered_from"'),
+    "contained_in_h4": re.compile(r'id="(?:Guaranteed|Chance)"'),
+    "contained_in_inline": re.compile(r'id="Contained_in"'),
+    "reward_track": re.compile(r'id="Reward_tracks"'),
+}
+
+
+_USER_PROMPT_HEADER = """\
 ## Item
 - ID: {item_id}
 - Name: {name}
 - Type: {item_type}
 - Rarity: {rarity}
 
-## Wiki Page HTML
+"""
+_EXAMPLES_HEADING = "## Examples\n\n"
+_WIKI_HTML_HEADING = "## Wiki Page HTML\n\n"
+_BATCH_PREAMBLE = """\
+The pages of {count} different items follow. Extract each item independently: apply every \
+rule to that item's own page, name and rarity only.
+
+Return ONLY newline-delimited JSON: exactly one line per item below, each line a complete \
+JSON object of the form \
+{{"itemId": <ID>, "entries": [...], "overallConfidence": <0.0-1.0>, "notes": "..."}}. \
+Do not wrap the lines in an array or object and do not pretty-print them.
+
+"""
+_BATCH_ITEM_HEADING = "# Item {index} of {count}\n\n"
+
+
+PROMPT_HASH = hashlib.sha256(
+    "\0".join(
+        [
+            SYSTEM_PROMPT,
+            _USER_PROMPT_HEADER,
+            _EXAMPLES_HEADING,
+            _WIKI_HTML_HEADING,
+            _BATCH_PREAMBLE,
+            _BATCH_ITEM_HEADING,
+            *EXAMPLES.values(),
+            *(marker.pattern for marker in _EXAMPLE_MARKERS.values()),
+        ]
+    ).encode()
+).hexdigest()[:16]
+
+
+def select_examples(wiki_html: str) -> list[str]:
+    return [name for name, marker in _EXAMPLE_MARKERS.items() if marker.search(wiki_html)]
+
 
-{wiki_html}"""
+def build_examples_section(example_names: list[str]) -> str:
+    if not example_names:
+        return ""
+    parts = [_EXAMPLES_HEADING]
+    for example_name in example_names:
+        parts.append(f"### {example_name}\n{EXAMPLES[example_name]}\n")
+    return "".join(parts)
+
+
+def build_user_prompt(
+    item_id: int,
+    name: str,
+    item_type: str,
+    rarity: str,
+    wiki_html: str,
+) -> str:
+    return "".join(
+        [
+            _USER_PROMPT_HEADER.format(
+                item_id=item_id, name=name, item_type=item_type, rarity=rarity
+            ),
+            build_examples_section(select_examples(wiki_html)),
+            _WIKI_HTML_HEADING,
+            wiki_html,
+        ]
+    )
+
+
+def build_batch_item_prompt(
+    item_id: int,
+    name: str,
+    item_type: str,
+    rarity: str,
+    wiki_html: str,
+) -> str:
+    """Build one item's part of a batch prompt; its examples are shared by the batch."""
+    return "".join(
+        [
+            _USER_PROMPT_HEADER.format(
+                item_id=item_id, name=name, item_type=item_type, rarity=rarity
+            ),
+            _WIKI_HTML_HEADING,
+            wiki_html,
+        ]
+    )
+
+
+def build_batch_user_prompt(item_prompts: list[str], example_names: list[str]) -> str:
+    """
+    Build a batch prompt from build_batch_item_prompt parts.
+
+    The examples selected for any item in the batch are emitted once, ahead
+    of all items, instead of once per item.
+    """
+    ordered_examples = [name for name in _EXAMPLE_MARKERS if name in example_names]
+    parts = [
+        _BATCH_PREAMBLE.format(count=len(item_prompts)),
+        build_examples_section(ordered_examples),
+    ]
+    for index, item_prompt in enumerate(item_prompts, start=1):
+        parts.append(_BATCH_ITEM_HEADING.format(index=index, count=len(item_prompts)))
+        parts.append(item_prompt)
+        parts.append("\n\n")
+    return "".join(parts)
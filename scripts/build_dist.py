@@ -1,12 +1,15 @@
 import gzip
+import hashlib
 import json
 import logging
+import pickle
+import shutil
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import yaml
-
-from src.gw2_data.models import ItemFile
+from src.gw2_data import models, yaml_io
+from src.gw2_data.models import ItemFile, ItemRequirement
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -17,6 +20,12 @@ DATA_DIR = REPO_ROOT / "data"
 INDEX_DIR = DATA_DIR / "index"
 ITEMS_DIR = DATA_DIR / "items"
 VENDORS_DIR = DATA_DIR / "vendors"
+BUILD_CACHE_PATH = DIST_DIR / ".build_cache.pkl"
+
+# Matches pydantic's model_dump_json output so every JSON column is compact.
+_JSON_SEPARATORS = (",", ":")
+
+ParsedItem = tuple[tuple, list[tuple[tuple, list[tuple]]]]
 
 SCHEMA = """
 CREATE TABLE items (
@@ -34,7 +43,7 @@ CREATE TABLE items (
 );
 
 CREATE TABLE acquisitions (
-    id                   INTEGER PRIMARY KEY AUTOINCREMENT,
+    id                   INTEGER PRIMARY KEY,
     item_id              INTEGER NOT NULL REFERENCES items(id),
     type                 TEXT NOT NULL,
     vendor_name          TEXT,
@@ -74,13 +83,6 @@ CREATE TABLE currency_names (
     currency_id INTEGER NOT NULL UNIQUE
 );
 
-CREATE INDEX idx_acq_item ON acquisitions(item_id);
-CREATE INDEX idx_acq_type ON acquisitions(type);
-CREATE INDEX idx_req_acq ON requirements(acquisition_id);
-CREATE INDEX idx_req_item ON requirements(item_id);
-CREATE INDEX idx_req_currency ON requirements(currency_id);
-CREATE INDEX idx_names ON item_names(name);
-
 CREATE TABLE vendors (
     name     TEXT NOT NULL PRIMARY KEY,
     wiki_url TEXT NOT NULL
@@ -109,172 +111,243 @@ CREATE TABLE waypoints (
     chat_link TEXT NOT NULL,
     FOREIGN KEY (zone, area) REFERENCES locations(zone, area)
 );
-
-CREATE INDEX idx_vendor_locs_vendor ON vendor_locations(vendor_name);
-CREATE INDEX idx_locations_zone ON locations(zone);
-CREATE INDEX idx_waypoints_location ON waypoints(zone, area);
 """
 
+# Created after the bulk load so each index is built in one pass.
+INDEXES = (
+    "CREATE INDEX idx_acq_item ON acquisitions(item_id)",
+    "CREATE INDEX idx_acq_type ON acquisitions(type)",
+    "CREATE INDEX idx_req_acq ON requirements(acquisition_id)",
+    "CREATE INDEX idx_req_item ON requirements(item_id)",
+    "CREATE INDEX idx_req_currency ON requirements(currency_id)",
+    "CREATE INDEX idx_names ON item_names(name)",
+    "CREATE INDEX idx_vendor_locs_vendor ON vendor_locations(vendor_name)",
+    "CREATE INDEX idx_locations_zone ON locations(zone)",
+    "CREATE INDEX idx_waypoints_location ON waypoints(zone, area)",
+)
+
+
+def _parse_item_file(item_file: Path) -> ParsedItem:
+    """
+    Parse and validate one item file into database rows.
+
+    Runs in a worker process. Returns the items row and, per acquisition,
+    its row plus (item_id, currency_id, quantity) requirement rows. The
+    acquisition id is assigned by the writer, in file order.
+    """
+    with open(item_file) as f:
+        data = yaml_io.load(f)
+
+    item = ItemFile.model_validate(data)
+
+    flags_json = json.dumps(item.flags, separators=_JSON_SEPARATORS) if item.flags else None
+    item_row = (
+        item.id,
+        item.name,
+        item.type,
+        item.rarity,
+        item.level,
+        item.icon,
+        item.description,
+        item.vendor_value,
+        flags_json,
+        item.wiki_url,
+        item.last_updated,
+    )
+
+    acquisition_rows = []
+    for acq in item.acquisitions:
+        salvage_item_id = acq.item_id if acq.type == "salvage" else None
+        container_item_id = acq.item_id if acq.type == "container" else None
+
+        metadata_json = None
+        if acq.metadata is not None:
+            if isinstance(acq.metadata, dict):
+                metadata_json = json.dumps(acq.metadata, separators=_JSON_SEPARATORS)
+            else:
+                metadata_json = acq.metadata.model_dump_json(by_alias=True, exclude_none=True)
+
+        acq_row = (
+            item.id,
+            acq.type,
+            acq.vendor_name,
+            acq.achievement_name,
+            acq.achievement_category,
+            acq.track_name,
+            container_item_id,
+            acq.container_name,
+            acq.node_name,
+            salvage_item_id,
+            acq.output_quantity,
+            acq.output_quantity_min,
+            acq.output_quantity_max,
+            acq.guaranteed,
+            acq.choice,
+            metadata_json,
+        )
+
+        requirement_rows = [
+            (req.item_id, None, req.quantity)
+            if isinstance(req, ItemRequirement)
+            else (None, req.currency_id, req.quantity)
+            for req in acq.requirements
+        ]
+        acquisition_rows.append((acq_row, requirement_rows))
+
+    return item_row, acquisition_rows
+
 
-def _bool_to_int(value: bool | None) -> int | None:
-    if value is None:
-        return None
-    return 1 if value else 0
+def _build_cache_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for source in (Path(__file__), Path(models.__file__)):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_build_cache(fingerprint: str) -> dict[str, tuple[int, int, ParsedItem]]:
+    try:
+        with open(BUILD_CACHE_PATH, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache["items"]
+
+
+def _save_build_cache(fingerprint: str, items: dict[str, tuple[int, int, ParsedItem]]) -> None:
+    BUILD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(BUILD_CACHE_PATH, "wb") as f:
+        pickle.dump(
+            {"fingerprint": fingerprint, "items": items}, f, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+
+def _parse_item_files(item_files: list[Path]) -> list[ParsedItem]:
+    """
+    Parse item files, reusing rows from the previous build where possible.
+
+    Rows are cached in BUILD_CACHE_PATH by file name, keyed on mtime and
+    size. The cache is discarded whenever this script or the models change.
+    Only changed files are parsed, in a process pool.
+    """
+    fingerprint = _build_cache_fingerprint()
+    cached = _load_build_cache(fingerprint)
+
+    entries: dict[str, tuple[int, int, ParsedItem]] = {}
+    stale: list[tuple[Path, int, int]] = []
+    for item_file in item_files:
+        stat = item_file.stat()
+        hit = cached.get(item_file.name)
+        if hit is not None and hit[:2] == (stat.st_mtime_ns, stat.st_size):
+            entries[item_file.name] = hit
+        else:
+            stale.append((item_file, stat.st_mtime_ns, stat.st_size))
+
+    logger.info("Reusing %d cached item file(s), parsing %d", len(entries), len(stale))
+    if stale:
+        with ProcessPoolExecutor() as executor:
+            parsed_items = executor.map(
+                _parse_item_file, [item_file for item_file, _, _ in stale], chunksize=64
+            )
+            for (item_file, mtime_ns, size), parsed in zip(stale, parsed_items, strict=True):
+                entries[item_file.name] = (mtime_ns, size, parsed)
+
+    _save_build_cache(fingerprint, entries)
+    return [entries[item_file.name][2] for item_file in item_files]
 
 
 def build_database(db_path: Path) -> None:
     logger.info("Creating SQLite database at %s", db_path)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
 
     try:
+        # The database is rebuilt from scratch on every run, so the load
+        # does not need crash safety. The journal stays in memory rather
+        # than off so the rollback on a failed build still works.
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA temp_store = MEMORY")
         cursor.execute("PRAGMA foreign_keys = OFF")
 
         logger.info("Creating schema...")
         cursor.executescript(SCHEMA)
 
+        cursor.execute("BEGIN IMMEDIATE")
+
         logger.info("Loading item files...")
         item_files = sorted(ITEMS_DIR.glob("*.yaml"))
         logger.info("Found %d item files", len(item_files))
 
-        items_inserted = 0
-        acquisitions_inserted = 0
-        requirements_inserted = 0
-
-        for item_file in item_files:
-            with open(item_file) as f:
-                data = yaml.safe_load(f)
+        item_rows: list[tuple] = []
+        acq_rows: list[tuple] = []
+        req_rows: list[tuple] = []
 
-            item = ItemFile.model_validate(data)
+        for item_row, acquisition_rows in _parse_item_files(item_files):
+            item_rows.append(item_row)
 
-            flags_json = json.dumps(item.flags) if item.flags else None
+            for acq_row, requirement_rows in acquisition_rows:
+                acquisition_id = len(acq_rows) + 1
+                acq_rows.append((acquisition_id, *acq_row))
+                req_rows.extend((acquisition_id, *req_row) for req_row in requirement_rows)
 
-            cursor.execute(
-                """
-                INSERT INTO items (
-                    id, name, type, rarity, level, icon, description,
-                    vendor_value, flags, wiki_url, last_updated
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    item.id,
-                    item.name,
-                    item.type,
-                    item.rarity,
-                    item.level,
-                    item.icon,
-                    item.description,
-                    item.vendor_value,
-                    flags_json,
-                    item.wiki_url,
-                    item.last_updated,
-                ),
+        cursor.executemany(
+            """
+            INSERT INTO items (
+                id, name, type, rarity, level, icon, description,
+                vendor_value, flags, wiki_url, last_updated
             )
-            items_inserted += 1
-
-            if item.acquisitions:
-                for acq in item.acquisitions:
-                    salvage_item_id = acq.item_id if acq.type == "salvage" else None
-                    container_item_id = acq.item_id if acq.type == "container" else None
-
-                    metadata_json = None
-                    if acq.metadata is not None:
-                        if isinstance(acq.metadata, dict):
-                            metadata_json = json.dumps(acq.metadata)
-                        else:
-                            metadata_json = acq.metadata.model_dump_json(
-                                by_alias=True, exclude_none=True
-                            )
-
-                    cursor.execute(
-                        """
-                        INSERT INTO acquisitions (
-                            item_id, type, vendor_name, achievement_name,
-                            achievement_category, track_name, container_item_id,
-                            container_name, node_name, salvage_item_id,
-                            output_quantity, output_quantity_min,
-                            output_quantity_max, guaranteed, choice, metadata
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            item.id,
-                            acq.type,
-                            acq.vendor_name,
-                            acq.achievement_name,
-                            acq.achievement_category,
-                            acq.track_name,
-                            container_item_id,
-                            acq.container_name,
-                            acq.node_name,
-                            salvage_item_id,
-                            acq.output_quantity,
-                            acq.output_quantity_min,
-                            acq.output_quantity_max,
-                            _bool_to_int(acq.guaranteed),
-                            _bool_to_int(acq.choice),
-                            metadata_json,
-                        ),
-                    )
-                    acquisition_id = cursor.lastrowid
-                    acquisitions_inserted += 1
-
-                    if acq.requirements:
-                        for req in acq.requirements:
-                            if hasattr(req, "item_id"):
-                                cursor.execute(
-                                    """
-                                    INSERT INTO requirements (acquisition_id, item_id, quantity)
-                                    VALUES (?, ?, ?)
-                                    """,
-                                    (acquisition_id, req.item_id, req.quantity),
-                                )
-                            else:
-                                cursor.execute(
-                                    """
-                                    INSERT INTO requirements (acquisition_id, currency_id, quantity)
-                                    VALUES (?, ?, ?)
-                                    """,
-                                    (acquisition_id, req.currency_id, req.quantity),
-                                )
-                            requirements_inserted += 1
-
-        logger.info("Inserted %d items", items_inserted)
-        logger.info("Inserted %d acquisitions", acquisitions_inserted)
-        logger.info("Inserted %d requirements", requirements_inserted)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            item_rows,
+        )
+        cursor.executemany(
+            """
+            INSERT INTO acquisitions (
+                id, item_id, type, vendor_name, achievement_name,
+                achievement_category, track_name, container_item_id,
+                container_name, node_name, salvage_item_id,
+                output_quantity, output_quantity_min,
+                output_quantity_max, guaranteed, choice, metadata
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            acq_rows,
+        )
+        cursor.executemany(
+            """
+            INSERT INTO requirements (acquisition_id, item_id, currency_id, quantity)
+            VALUES (?, ?, ?, ?)
+            """,
+            req_rows,
+        )
+
+        logger.info("Inserted %d items", len(item_rows))
+        logger.info("Inserted %d acquisitions", len(acq_rows))
+        logger.info("Inserted %d requirements", len(req_rows))
 
         logger.info("Loading item name index...")
         with open(INDEX_DIR / "item_names.yaml") as f:
-            item_names = yaml.safe_load(f)
-
-        item_names_inserted = 0
-        for name, item_ids in item_names.items():
-            if isinstance(item_ids, int):
-                item_ids = [item_ids]
-            for item_id in item_ids:
-                cursor.execute(
-                    "INSERT INTO item_names (name, item_id) VALUES (?, ?)",
-                    (name, item_id),
-                )
-                item_names_inserted += 1
+            item_names = yaml_io.load(f)
 
-        logger.info("Inserted %d item name mappings", item_names_inserted)
+        item_name_rows = [
+            (name, item_id) for name, item_ids in item_names.items() for item_id in item_ids
+        ]
+
+        cursor.executemany("INSERT INTO item_names (name, item_id) VALUES (?, ?)", item_name_rows)
+        logger.info("Inserted %d item name mappings", len(item_name_rows))
 
         logger.info("Loading currency name index...")
         with open(INDEX_DIR / "currency_names.yaml") as f:
-            currency_names = yaml.safe_load(f)
-
-        currency_names_inserted = 0
-        for name, currency_id in currency_names.items():
-            cursor.execute(
-                "INSERT INTO currency_names (name, currency_id) VALUES (?, ?)",
-                (name, currency_id),
-            )
-            currency_names_inserted += 1
+            currency_names = yaml_io.load(f)
 
-        logger.info("Inserted %d currency name mappings", currency_names_inserted)
+        cursor.executemany(
+            "INSERT INTO currency_names (name, currency_id) VALUES (?, ?)",
+            currency_names.items(),
+        )
+        logger.info("Inserted %d currency name mappings", len(currency_names))
 
         vendors_file = VENDORS_DIR / "vendors.yaml"
         locations_file = VENDORS_DIR / "locations.yaml"
@@ -282,55 +355,56 @@ def build_database(db_path: Path) -> None:
         if vendors_file.exists() and locations_file.exists():
             logger.info("Loading vendor data...")
             with open(vendors_file) as f:
-                vendors_data = yaml.safe_load(f) or {}
+                vendors_data = yaml_io.load(f) or {}
             with open(locations_file) as f:
-                locations_data = yaml.safe_load(f) or {}
-
-            vendors_inserted = 0
-            vendor_locations_inserted = 0
-            locations_inserted = 0
-            waypoints_inserted = 0
+                locations_data = yaml_io.load(f) or {}
 
+            location_rows: list[tuple[str, str, str]] = []
+            waypoint_rows: list[tuple[str, str, str, str]] = []
             for zone_name, areas in locations_data.items():
                 for area_name, loc in areas.items():
-                    cursor.execute(
-                        "INSERT INTO locations (zone, area, wiki_url) VALUES (?, ?, ?)",
-                        (zone_name, area_name, loc["wikiUrl"]),
+                    location_rows.append((zone_name, area_name, loc["wikiUrl"]))
+                    waypoint_rows.extend(
+                        (zone_name, area_name, wp["name"], wp["chatLink"])
+                        for wp in loc.get("waypoints", [])
                     )
-                    locations_inserted += 1
-                    for wp in loc.get("waypoints", []):
-                        cursor.execute(
-                            """
-                            INSERT INTO waypoints (zone, area, name, chat_link)
-                            VALUES (?, ?, ?, ?)
-                            """,
-                            (zone_name, area_name, wp["name"], wp["chatLink"]),
-                        )
-                        waypoints_inserted += 1
 
+            vendor_rows: list[tuple[str, str]] = []
+            vendor_location_rows: list[tuple[str, str, str]] = []
             for vendor_name, vendor in vendors_data.items():
-                cursor.execute(
-                    "INSERT INTO vendors (name, wiki_url) VALUES (?, ?)",
-                    (vendor_name, vendor["wikiUrl"]),
+                vendor_rows.append((vendor_name, vendor["wikiUrl"]))
+                vendor_location_rows.extend(
+                    (vendor_name, loc_ref["zone"], loc_ref["area"])
+                    for loc_ref in vendor.get("locations", [])
                 )
-                vendors_inserted += 1
-                for loc_ref in vendor.get("locations", []):
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO vendor_locations (vendor_name, zone, area)
-                        VALUES (?, ?, ?)
-                        """,
-                        (vendor_name, loc_ref["zone"], loc_ref["area"]),
-                    )
-                    vendor_locations_inserted += 1
 
-            logger.info("Inserted %d locations", locations_inserted)
-            logger.info("Inserted %d waypoints", waypoints_inserted)
-            logger.info("Inserted %d vendors", vendors_inserted)
-            logger.info("Inserted %d vendor-location mappings", vendor_locations_inserted)
+            cursor.executemany(
+                "INSERT INTO locations (zone, area, wiki_url) VALUES (?, ?, ?)", location_rows
+            )
+            cursor.executemany(
+                "INSERT INTO waypoints (zone, area, name, chat_link) VALUES (?, ?, ?, ?)",
+                waypoint_rows,
+            )
+            cursor.executemany("INSERT INTO vendors (name, wiki_url) VALUES (?, ?)", vendor_rows)
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO vendor_locations (vendor_name, zone, area)
+                VALUES (?, ?, ?)
+                """,
+                vendor_location_rows,
+            )
+
+            logger.info("Inserted %d locations", len(location_rows))
+            logger.info("Inserted %d waypoints", len(waypoint_rows))
+            logger.info("Inserted %d vendors", len(vendor_rows))
+            logger.info("Inserted %d vendor-location mappings", len(vendor_location_rows))
         else:
             logger.info("No vendor data found at %s — skipping", VENDORS_DIR)
 
+        logger.info("Creating indexes...")
+        for statement in INDEXES:
+            cursor.execute(statement)
+
         logger.info("Enabling foreign keys and verifying integrity...")
         cursor.execute("PRAGMA foreign_keys = ON")
         violations = cursor.execute("PRAGMA foreign_key_check").fetchall()
@@ -353,75 +427,52 @@ def build_database(db_path: Path) -> None:
         conn.close()
 
 
+MISSING_REFERENCES_QUERY = """
+SELECT DISTINCT 'container', a.container_item_id
+FROM acquisitions a
+WHERE a.container_item_id IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM items WHERE id = a.container_item_id)
+UNION ALL
+SELECT DISTINCT 'salvage', a.salvage_item_id
+FROM acquisitions a
+WHERE a.salvage_item_id IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM items WHERE id = a.salvage_item_id)
+UNION ALL
+SELECT DISTINCT 'requirement_item', r.item_id
+FROM requirements r
+WHERE r.item_id IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM items WHERE id = r.item_id)
+UNION ALL
+SELECT DISTINCT 'requirement_currency', r.currency_id
+FROM requirements r
+WHERE r.currency_id IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM currency_names WHERE currency_id = r.currency_id)
+ORDER BY 1, 2
+"""
+
+_MISSING_REFERENCE_LABELS = {
+    "container": "container item(s)",
+    "salvage": "salvage source item(s)",
+    "requirement_item": "requirement item(s)",
+    "requirement_currency": "requirement currency(ies)",
+}
+
+
 def validate_references(db_path: Path) -> None:
     logger.info("Validating item and currency references...")
 
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    warnings = []
-
-    missing_container_items = cursor.execute(
-        """
-        SELECT DISTINCT a.container_item_id
-        FROM acquisitions a
-        WHERE a.container_item_id IS NOT NULL
-          AND NOT EXISTS (SELECT 1 FROM items WHERE id = a.container_item_id)
-        ORDER BY a.container_item_id
-        """
-    ).fetchall()
-
-    if missing_container_items:
-        ids = [str(row[0]) for row in missing_container_items]
-        msg = f"Found {len(missing_container_items)} container item(s) not in database: "
-        warnings.append(msg + ", ".join(ids))
-
-    missing_salvage_items = cursor.execute(
-        """
-        SELECT DISTINCT a.salvage_item_id
-        FROM acquisitions a
-        WHERE a.salvage_item_id IS NOT NULL
-          AND NOT EXISTS (SELECT 1 FROM items WHERE id = a.salvage_item_id)
-        ORDER BY a.salvage_item_id
-        """
-    ).fetchall()
-
-    if missing_salvage_items:
-        ids = [str(row[0]) for row in missing_salvage_items]
-        msg = f"Found {len(missing_salvage_items)} salvage source item(s) not in database: "
-        warnings.append(msg + ", ".join(ids))
-
-    missing_requirement_items = cursor.execute(
-        """
-        SELECT DISTINCT r.item_id
-        FROM requirements r
-        WHERE r.item_id IS NOT NULL
-          AND NOT EXISTS (SELECT 1 FROM items WHERE id = r.item_id)
-        ORDER BY r.item_id
-        """
-    ).fetchall()
-
-    if missing_requirement_items:
-        ids = [str(row[0]) for row in missing_requirement_items]
-        msg = f"Found {len(missing_requirement_items)} requirement item(s) not in database: "
-        warnings.append(msg + ", ".join(ids))
-
-    missing_requirement_currencies = cursor.execute(
-        """
-        SELECT DISTINCT r.currency_id
-        FROM requirements r
-        WHERE r.currency_id IS NOT NULL
-          AND NOT EXISTS (SELECT 1 FROM currency_names WHERE currency_id = r.currency_id)
-        ORDER BY r.currency_id
-        """
-    ).fetchall()
-
-    if missing_requirement_currencies:
-        ids = [str(row[0]) for row in missing_requirement_currencies]
-        count = len(missing_requirement_currencies)
-        warnings.append(
-            f"Found {count} requirement currency(ies) not in database: " + ", ".join(ids)
-        )
+    missing: dict[str, list[str]] = {kind: [] for kind in _MISSING_REFERENCE_LABELS}
+    for kind, ref_id in cursor.execute(MISSING_REFERENCES_QUERY):
+        missing[kind].append(str(ref_id))
+
+    warnings = [
+        f"Found {len(ids)} {_MISSING_REFERENCE_LABELS[kind]} not in database: " + ", ".join(ids)
+        for kind, ids in missing.items()
+        if ids
+    ]
 
     conn.close()
 
@@ -438,9 +489,8 @@ def validate_references(db_path: Path) -> None:
 def compress_database(db_path: Path, gz_path: Path) -> None:
     logger.info("Compressing database to %s", gz_path)
 
-    with open(db_path, "rb") as f_in:
-        with gzip.open(gz_path, "wb", compresslevel=9) as f_out:
-            f_out.write(f_in.read())
+    with open(db_path, "rb") as f_in, gzip.open(gz_path, "wb", compresslevel=9) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=1 << 20)
 
     db_size = db_path.stat().st_size
     gz_size = gz_path.stat().st_size
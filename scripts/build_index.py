@@ -1,17 +1,19 @@
 import argparse
 import logging
 import sys
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import yaml
 
-from gw2_data import api
+from gw2_data import api, yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import APIError
-from gw2_data.types import GW2Item
+from gw2_data.types import BulkResult, GW2Item
 
 log = logging.getLogger(__name__)
 
@@ -20,13 +22,14 @@ ITEM_NAMES_PATH = INDEX_DIR / "item_names.yaml"
 CURRENCY_NAMES_PATH = INDEX_DIR / "currency_names.yaml"
 BATCH_SIZE = 200
 BATCH_DELAY = 0.1
+MAX_WORKERS = 8
 
 
-class _IndexDumper(yaml.Dumper):
+class _IndexDumper(yaml_io.SafeDumper):
     pass
 
 
-def _list_representer(dumper: yaml.Dumper, data: list) -> yaml.Node:
+def _list_representer(dumper: yaml_io.SafeDumper, data: list) -> yaml.Node:
     return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
 
 
@@ -53,6 +56,29 @@ def _index_item(
     name_index[name].append(item_id)
 
 
+class _RequestPacer:
+    """Space API requests at least `interval` seconds apart across all workers."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _fetch_batch(
+    batch_ids: list[int], cache: CacheClient, force: bool, pacer: _RequestPacer
+) -> BulkResult:
+    return api.get_items_bulk(batch_ids, cache, force=force, before_request=pacer.wait)
+
+
 def build_currency_index() -> None:
     import httpx
 
@@ -95,7 +121,7 @@ def build_currency_index() -> None:
     INDEX_DIR.mkdir(parents=True, exist_ok=True)
 
     with CURRENCY_NAMES_PATH.open("w") as f:
-        yaml.dump(sorted_index, f, allow_unicode=True, sort_keys=False)
+        yaml_io.dump(sorted_index, f, allow_unicode=True, sort_keys=False)
 
     print(f"\nCurrency index written to {CURRENCY_NAMES_PATH}")
     print(f"  Total currencies indexed: {len(sorted_index)}")
@@ -114,42 +140,40 @@ def build_item_index(cache: CacheClient, *, force: bool = False) -> None:
     skipped_empty: list[int] = []
     cleaned_newlines: list[tuple[int, str]] = []
     fetched_count = 0
+    # One pacer for all workers keeps the total rate at 1/BATCH_DELAY requests/s.
+    pacer = _RequestPacer(BATCH_DELAY)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_fetch_batch, batch_ids, cache, force, pacer): (i + 1, batch_ids)
+            for i, batch_ids in enumerate(batches)
+        }
+        for completed, future in enumerate(as_completed(futures), start=1):
+            batch_num, batch_ids = futures[future]
+            try:
+                result = future.result()
+                for item in result.items:
+                    _index_item(item, name_index, skipped_empty, cleaned_newlines)
+                fetched_count += len(result.items)
+            except APIError as e:
+                log.warning("Batch %d/%d failed: %s", batch_num, total_batches, e)
+                failed_batches.append((batch_num, batch_ids))
 
-    for i, batch_ids in enumerate(batches):
-        batch_num = i + 1
-        from_cache = False
-        try:
-            result = api.get_items_bulk(batch_ids, cache, force=force)
-            from_cache = result.from_cache
-            for item in result.items:
-                _index_item(item, name_index, skipped_empty, cleaned_newlines)
-            fetched_count += len(result.items)
-        except APIError as e:
-            log.warning("Batch %d/%d failed: %s", batch_num, total_batches, e)
-            failed_batches.append((batch_num, batch_ids))
-
-        if batch_num % 10 == 0 or batch_num == total_batches:
-            print(f"  Progress: {batch_num}/{total_batches} batches ({fetched_count:,} items)")
-
-        if batch_num < total_batches and not from_cache:
-            time.sleep(BATCH_DELAY)
+            if completed % 10 == 0 or completed == total_batches:
+                print(f"  Progress: {completed}/{total_batches} batches ({fetched_count:,} items)")
 
     if failed_batches:
         print(f"\nRetrying {len(failed_batches)} failed batch(es)...")
         still_failed = []
-        for batch_num, batch_ids in failed_batches:
-            from_cache = False
+        for batch_num, batch_ids in sorted(failed_batches):
             try:
-                result = api.get_items_bulk(batch_ids, cache, force=force)
-                from_cache = result.from_cache
+                result = _fetch_batch(batch_ids, cache, force, pacer)
                 for item in result.items:
                     _index_item(item, name_index, skipped_empty, cleaned_newlines)
                 fetched_count += len(result.items)
             except APIError as e:
                 log.error("Batch %d retry failed: %s", batch_num, e)
                 still_failed.append((batch_num, batch_ids))
-            if not from_cache:
-                time.sleep(BATCH_DELAY)
 
         if still_failed:
             failed_ids_count = sum(len(ids) for _, ids in still_failed)
@@ -159,11 +183,11 @@ def build_item_index(cache: CacheClient, *, force: bool = False) -> None:
             )
 
     if skipped_empty:
-        print(f"\nSkipped {len(skipped_empty)} item(s) with empty names: {skipped_empty}")
+        print(f"\nSkipped {len(skipped_empty)} item(s) with empty names: {sorted(skipped_empty)}")
 
     if cleaned_newlines:
         print(f"\nCleaned newlines from {len(cleaned_newlines)} item name(s):")
-        for item_id, raw_name in cleaned_newlines:
+        for item_id, raw_name in sorted(cleaned_newlines):
             print(f"  ID {item_id}: {raw_name}")
 
     sorted_index: dict[str, list[int]] = {}
@@ -173,7 +197,7 @@ def build_item_index(cache: CacheClient, *, force: bool = False) -> None:
     INDEX_DIR.mkdir(parents=True, exist_ok=True)
 
     with ITEM_NAMES_PATH.open("w") as f:
-        yaml.dump(sorted_index, f, Dumper=_IndexDumper, allow_unicode=True, sort_keys=False)
+        yaml_io.dump(sorted_index, f, Dumper=_IndexDumper, allow_unicode=True, sort_keys=False)
 
     print(f"\nItem index written to {ITEM_NAMES_PATH}")
     print(f"  Unique names: {len(sorted_index):,}")
@@ -7,12 +7,13 @@ updated YAML with containerName populated.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 from pydantic import ValidationError
 
-from gw2_data import api, terminal
+from gw2_data import api, terminal, yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import APIError
@@ -20,10 +21,73 @@ from gw2_data.models import ItemFile
 
 log = logging.getLogger(__name__)
 
+# Item files are written by yaml.dump, which never quotes this value, so
+# files without the marker have no container acquisitions to migrate.
+_CONTAINER_MARKER = b"type: container"
+_BULK_BATCH_SIZE = 200
 
-def migrate_file(file_path: Path, cache: CacheClient, dry_run: bool) -> bool:
-    with file_path.open() as f:
-        data = yaml.safe_load(f)
+
+def _container_name(item_id: int, cache: CacheClient, names: dict[int, str]) -> str:
+    name = names.get(item_id)
+    if name is None:
+        name = names[item_id] = api.get_item(item_id, cache)["name"]
+    return name
+
+
+def _unnamed_container_ids(data: dict) -> set[int]:
+    return {
+        acq["itemId"]
+        for acq in data.get("acquisitions", [])
+        if acq.get("type") == "container" and "itemId" in acq and "containerName" not in acq
+    }
+
+
+def _prefetch_container_items(yaml_files: list[Path], cache: CacheClient) -> list[Path]:
+    """
+    Bulk-fetch every unnamed container item and return the files to migrate.
+
+    Container items are fetched 200 per request into the API cache, so the
+    per-file lookups in migrate_file are cache hits. Files that fail to
+    parse are returned too, so migrate_file reports them.
+    """
+    pending_files: list[Path] = []
+    item_ids: set[int] = set()
+    for file_path in yaml_files:
+        raw = file_path.read_bytes()
+        if _CONTAINER_MARKER not in raw:
+            continue
+        try:
+            file_ids = _unnamed_container_ids(yaml_io.load(raw))
+        except yaml.YAMLError:
+            pending_files.append(file_path)
+            continue
+        if file_ids:
+            pending_files.append(file_path)
+            item_ids |= file_ids
+
+    sorted_ids = sorted(item_ids)
+    for start in range(0, len(sorted_ids), _BULK_BATCH_SIZE):
+        try:
+            api.get_items_bulk(sorted_ids[start : start + _BULK_BATCH_SIZE], cache)
+        except APIError as e:
+            terminal.warning(f"Bulk prefetch failed, falling back to single lookups: {e}")
+
+    return pending_files
+
+
+def migrate_file(
+    file_path: Path,
+    cache: CacheClient,
+    dry_run: bool,
+    names: dict[int, str] | None = None,
+) -> bool:
+    if names is None:
+        names = {}
+    raw = file_path.read_bytes()
+    if _CONTAINER_MARKER not in raw:
+        return False
+
+    data = yaml_io.load(raw)
 
     acquisitions = data.get("acquisitions", [])
     modified = False
@@ -33,8 +97,7 @@ def migrate_file(file_path: Path, cache: CacheClient, dry_run: bool) -> bool:
             if "itemId" in acq and "containerName" not in acq:
                 item_id = acq["itemId"]
                 try:
-                    item_data = api.get_item(item_id, cache)
-                    container_name = item_data["name"]
+                    container_name = _container_name(item_id, cache, names)
                     acq["containerName"] = container_name
                     modified = True
                     terminal.debug(
@@ -61,13 +124,23 @@ def migrate_file(file_path: Path, cache: CacheClient, dry_run: bool) -> bool:
         terminal.info(f"  {file_path.name}: Would update (dry run)")
         return True
 
-    with file_path.open("w") as f:
-        f.write(new_yaml)
+    file_path.write_text(new_yaml)
 
     return True
 
 
-def migrate_all_files(dry_run: bool = False) -> None:
+def _migrate_file_captured(
+    file_path: Path, cache: CacheClient, dry_run: bool, names: dict[int, str]
+) -> tuple[bool, str]:
+    with terminal.captured() as output:
+        try:
+            return migrate_file(file_path, cache, dry_run, names), output.getvalue()
+        except Exception as e:
+            terminal.error(f"  {file_path.name}: Unexpected error: {e}")
+            return False, output.getvalue()
+
+
+def migrate_all_files(dry_run: bool = False, workers: int = 8) -> None:
     settings = get_settings()
     cache = CacheClient(settings.cache_dir)
 
@@ -78,15 +151,21 @@ def migrate_all_files(dry_run: bool = False) -> None:
 
     yaml_files = sorted(items_dir.glob("*.yaml"))
     terminal.subsection(f"Migrating {len(yaml_files)} YAML files...")
+    yaml_files = _prefetch_container_items(yaml_files, cache)
 
+    # Container names resolved during this run, shared by all workers.
+    names: dict[int, str] = {}
     migrated_count = 0
-    for file_path in yaml_files:
-        try:
-            if migrate_file(file_path, cache, dry_run):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_migrate_file_captured, file_path, cache, dry_run, names)
+            for file_path in yaml_files
+        ]
+        for future in futures:
+            migrated, output = future.result()
+            terminal.write(output)
+            if migrated:
                 migrated_count += 1
-        except Exception as e:
-            terminal.error(f"  {file_path.name}: Unexpected error: {e}")
-            continue
 
     terminal.success(
         f"\n✓ Migration complete: {migrated_count} file(s) updated "
@@ -105,6 +184,12 @@ def main() -> None:
         action="store_true",
         help="Show what would be changed without writing files",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of files to migrate concurrently (default: 8)",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -112,7 +197,7 @@ def main() -> None:
         format="%(levelname)s: %(message)s",
     )
 
-    migrate_all_files(dry_run=args.dry_run)
+    migrate_all_files(dry_run=args.dry_run, workers=args.workers)
 
 
 if __name__ == "__main__":
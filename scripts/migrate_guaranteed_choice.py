@@ -5,20 +5,33 @@ Processes all YAML files in data/items/ and:
 1. Moves metadata.guaranteed → top-level guaranteed
 2. Moves metadata.choice → top-level choice
 3. Preserves all other fields and formatting
-4. Validates output against schema
+4. Validates the migrated acquisitions against the schema
 """
 
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import TypeAdapter
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from gw2_data.models import ItemFile
+from gw2_data import yaml_io
+from gw2_data.models import Acquisition
 from gw2_data.sorter import sort_acquisitions
 
+# Acquisition fields sit two spaces deep in item files, so a guaranteed or
+# choice key indented further can only be inside metadata.
+_NESTED_FIELD_RE = re.compile(rb"^ {4,}(?:guaranteed|choice):", re.MULTILINE)
+_CHUNK_SIZE = 64
+# Only acquisitions change, and ItemFile has no cross-field validators, so
+# validating the acquisition list is as strict as validating the file.
+_ACQUISITIONS = TypeAdapter(list[Acquisition])
+
 
 def migrate_acquisition(acq: dict[str, Any]) -> dict[str, Any]:
     metadata = acq.get("metadata", {})
@@ -45,8 +58,11 @@ def migrate_acquisition(acq: dict[str, Any]) -> dict[str, Any]:
 
 
 def migrate_file(file_path: Path, dry_run: bool = False) -> bool:
-    with open(file_path) as f:
-        data = yaml.safe_load(f)
+    raw = file_path.read_bytes()
+    if not _NESTED_FIELD_RE.search(raw):
+        return False
+
+    data = yaml_io.load(raw)
 
     if not data or "acquisitions" not in data:
         return False
@@ -71,22 +87,28 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> bool:
 
     data["acquisitions"] = sort_acquisitions(new_acquisitions)
 
-    ItemFile.model_validate(data)
+    _ACQUISITIONS.validate_python(data["acquisitions"])
 
     if not dry_run:
-        with open(file_path, "w") as f:
-            yaml.dump(
-                data,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-                width=float("inf"),
-            )
+        new_yaml = yaml.dump(
+            data,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+            width=float("inf"),
+        )
+        file_path.write_text(new_yaml)
 
     return True
 
 
+def _migrate_file_safe(file_path: Path, dry_run: bool) -> tuple[bool, str | None]:
+    try:
+        return migrate_file(file_path, dry_run=dry_run), None
+    except Exception as e:
+        return False, str(e)
+
+
 def main() -> None:
     import argparse
 
@@ -108,15 +130,22 @@ def main() -> None:
 
     print(f"Processing {total_count} YAML files...")
 
-    for file_path in yaml_files:
-        try:
-            if migrate_file(file_path, dry_run=args.dry_run):
+    failed = False
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            _migrate_file_safe, yaml_files, repeat(args.dry_run), chunksize=_CHUNK_SIZE
+        )
+        for file_path, (migrated, error) in zip(yaml_files, results, strict=True):
+            if error is not None:
+                print(f"Error processing {file_path.name}: {error}")
+                failed = True
+            elif migrated:
                 migrated_count += 1
                 action = "Would migrate" if args.dry_run else "Migrated"
                 print(f"{action}: {file_path.name}")
-        except Exception as e:
-            print(f"Error processing {file_path.name}: {e}")
-            sys.exit(1)
+
+    if failed:
+        sys.exit(1)
 
     action = "would be migrated" if args.dry_run else "migrated"
     print(f"\n{migrated_count}/{total_count} files {action}")
@@ -20,11 +20,54 @@ from pathlib import Path
 import yaml
 from pydantic import ValidationError
 
-from gw2_data import api, llm, resolver, sorter, terminal, wiki
+from gw2_data import api, llm, resolver, sorter, terminal, wiki, yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import APIError, ExtractionError, MultipleItemMatchError, WikiError
 from gw2_data.models import ItemFile
+from gw2_data.types import GW2Item, NameIndexes
+
+
+def _same_item_data(existing: dict, new: dict) -> bool:
+    """Compare item data ignoring lastUpdated, which is always today's date."""
+    return {k: v for k, v in existing.items() if k != "lastUpdated"} == {
+        k: v for k, v in new.items() if k != "lastUpdated"
+    }
+
+
+def _is_basic_ingredient(item: GW2Item) -> bool:
+    return item["type"] == "CraftingMaterial" and item.get("description") == "Ingredient"
+
+
+def prefetch_extractions(item_ids: list[int], cache: CacheClient, model: str | None = None) -> None:
+    """
+    Warm the LLM extraction cache for several items with batched CLI calls.
+
+    Items that fail to fetch here are left to populate_item, which reports
+    the error when it retries them.
+    """
+    wiki_page_overrides = api.load_wiki_page_overrides()
+    requests: list[llm.ExtractionRequest] = []
+    for item_id in item_ids:
+        try:
+            item_data_api = api.get_item(item_id, cache=cache)
+            if _is_basic_ingredient(item_data_api):
+                continue
+            wiki_page_name = wiki_page_overrides.get(item_id, item_data_api["name"])
+            wiki_html = wiki.get_page_html(wiki_page_name, cache=cache)
+        except (APIError, WikiError) as e:
+            terminal.debug(f"Prefetch skipped item {item_id}: {e}")
+            continue
+        requests.append(
+            llm.ExtractionRequest(item_id, item_data_api["name"], wiki_html, item_data_api)
+        )
+
+    if len(requests) < 2:
+        return
+    try:
+        llm.extract_entries_batch(requests, cache=cache, model=model)
+    except ExtractionError as e:
+        terminal.warning(f"Batch extraction failed, falling back to per-item calls: {e}")
 
 
 def populate_item(
@@ -34,6 +77,7 @@ def populate_item(
     dry_run: bool = False,
     model: str | None = None,
     strict: bool = True,
+    indexes: NameIndexes | None = None,
 ) -> None:
     if item_id <= 0:
         raise ValueError(f"Item ID must be positive, got {item_id}")
@@ -50,13 +94,9 @@ def populate_item(
 
     wiki_page_overrides = api.load_wiki_page_overrides()
     wiki_page_name = wiki_page_overrides.get(item_id, item_name)
+    wiki_url = wiki.page_url(wiki_page_name)
 
-    is_basic_ingredient = (
-        item_data_api["type"] == "CraftingMaterial"
-        and item_data_api.get("description") == "Ingredient"
-    )
-
-    if is_basic_ingredient:
+    if _is_basic_ingredient(item_data_api):
         terminal.info("Basic ingredient - skipping wiki/LLM extraction")
         acquisitions = []
         overall_confidence = 1.0
@@ -66,7 +106,6 @@ def populate_item(
         if wiki_page_name != item_name:
             terminal.info(f"Using wiki page override: '{wiki_page_name}'")
         wiki_html = wiki.get_page_html(wiki_page_name, cache=cache)
-        wiki_url = f"https://wiki.guildwars2.com/wiki/{wiki_page_name.replace(' ', '_')}"
         terminal.debug(f"Wiki page: {len(wiki_html):,} chars")
         terminal.info(f"  {terminal.link(wiki_url, 'View on Wiki')}")
 
@@ -80,14 +119,13 @@ def populate_item(
         _print_extraction_summary(result.entries, overall_confidence, entry_confidences, notes)
 
         terminal.subsection("Classifying and resolving acquisitions")
-        item_name_index = api.load_item_name_index()
-        currency_name_index = api.load_currency_name_index()
-        gathering_node_index = api.load_gathering_node_index()
+        if indexes is None:
+            indexes = api.load_name_indexes(cache)
         acquisitions = resolver.classify_and_resolve(
             result.entries,
-            item_name_index,
-            currency_name_index,
-            gathering_node_index,
+            indexes.items,
+            indexes.currencies,
+            indexes.gathering_nodes,
             strict=strict,
             current_item_id=item_id,
         )
@@ -102,7 +140,7 @@ def populate_item(
         "description": item_data_api.get("description"),
         "vendorValue": item_data_api.get("vendor_value"),
         "flags": item_data_api.get("flags", []),
-        "wikiUrl": f"https://wiki.guildwars2.com/wiki/{wiki_page_name.replace(' ', '_')}",
+        "wikiUrl": wiki_url,
         "lastUpdated": datetime.now(UTC).date().isoformat(),
         "acquisitions": acquisitions,
     }
@@ -127,6 +165,14 @@ def populate_item(
     new_yaml = yaml.dump(yaml_content, sort_keys=False, allow_unicode=True)
 
     if output_path.exists():
+        try:
+            existing = yaml_io.load(output_path.read_bytes())
+        except yaml.YAMLError:
+            # Empty or truncated files (e.g. an interrupted write) are just rewritten.
+            existing = None
+        if isinstance(existing, dict) and _same_item_data(existing, yaml_content):
+            terminal.info("No changes from existing file.")
+            return
         terminal.info("File already exists and will be overwritten.")
 
     if dry_run:
@@ -171,7 +217,7 @@ def _handle_multiple_matches_interactive(
     terminal.error(f"Item name '{name}' matches multiple IDs")
     terminal.info("\nFetching item details to help you choose...\n")
 
-    wiki_url = f"https://wiki.guildwars2.com/wiki/{name.replace(' ', '_')}"
+    wiki_url = wiki.page_url(name)
     ids_param = ",".join(str(id) for id in item_ids)
     api_url = f"https://api.guildwars2.com/v2/items?ids={ids_param}"
 
@@ -198,34 +244,30 @@ def _handle_multiple_matches_interactive(
     terminal.bullet("Use --item-id with the specific ID you want", indent=2)
 
 
-def _acquisition_label(acq: dict) -> str:
-    meta = acq.get("metadata", {}) or {}
-    acq_type = acq.get("type", "")
-    if acq_type == "vendor":
-        return acq.get("vendorName", "unknown vendor")
-    if acq_type in ("crafting", "mystic_forge"):
-        reqs = acq.get("requirements", [])
-        ingredients = [r.get("requirementName", "?") for r in reqs]
-        return ", ".join(ingredients[:4]) + ("..." if len(ingredients) > 4 else "")
-    if acq_type == "achievement":
-        return acq.get("achievementName", "unknown achievement")
-    if acq_type in ("wvw_reward", "pvp_reward"):
-        return acq.get("trackName", "unknown track")
-    if acq_type == "wizards_vault":
-        reqs = acq.get("requirements", [])
-        cost = reqs[0].get("quantity", "?") if reqs else "?"
-        return f"{cost} Astral Acclaim"
-    if acq_type == "container":
-        return acq.get("containerName", "unknown")
-    if acq_type == "salvage":
-        return acq.get("requirementName", "unknown")
-    if acq_type == "resource_node":
-        return acq.get("nodeName", "unknown")
-    if acq_type == "map_reward":
-        return meta.get("rewardType", meta.get("regionName", "unknown reward"))
-    if acq_type == "other":
-        return meta.get("notes", "no description")
-    return ""
+def resolve_item_names(names: list[str], index: dict[str, list[int]]) -> list[int]:
+    """
+    Resolve item names to IDs against an already loaded name index.
+
+    Blank lines are ignored. Names with no match or several matches are
+    reported and left out.
+    """
+    item_ids: list[int] = []
+    requested = 0
+    for name in names:
+        cleaned_name = api.clean_name(name)
+        if not cleaned_name:
+            continue
+        requested += 1
+        matches = index.get(cleaned_name)
+        if not matches:
+            terminal.error(f"No item found with name '{cleaned_name}'")
+        elif len(matches) > 1:
+            ids = ", ".join(str(m) for m in matches)
+            terminal.error(f"Multiple items match '{cleaned_name}' ({ids}); use --item-id")
+        else:
+            item_ids.append(matches[0])
+    terminal.info(f"Resolved {len(item_ids)}/{requested} name(s) to item IDs")
+    return item_ids
 
 
 def main() -> None:
@@ -239,11 +281,17 @@ def main() -> None:
         help="GW2 item ID(s) (comma-separated for multiple, e.g. 19676,19684)",
     )
     group.add_argument("--item-name", type=str, help="GW2 item name (resolved via index)")
+    group.add_argument(
+        "--item-names-file",
+        type=Path,
+        metavar="FILE",
+        help="File of GW2 item names, one per line (resolved via index)",
+    )
     group.add_argument(
         "--clear-cache",
         nargs="*",
         metavar="TAG",
-        help="Clear cache (optionally specify tags: api, wiki, llm)",
+        help="Clear cache (optionally specify tags: api, wiki, llm, index)",
     )
 
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files")
@@ -288,9 +336,10 @@ def main() -> None:
 
     try:
         item_ids: list[int] = []
+        indexes: NameIndexes | None = None
 
         if args.item_name:
-            index = api.load_item_name_index()
+            index = api.load_item_name_index(cache)
             cleaned_name = api.clean_name(args.item_name)
             matches = index.get(cleaned_name)
             if not matches:
@@ -302,6 +351,13 @@ def main() -> None:
                 sys.exit(1)
             item_ids = [matches[0]]
             terminal.info(f"Resolved '{args.item_name}' to item ID {item_ids[0]}")
+        elif args.item_names_file:
+            indexes = api.load_name_indexes(cache)
+            names = args.item_names_file.read_text().splitlines()
+            item_ids = resolve_item_names(names, indexes.items)
+            if not item_ids:
+                terminal.error(f"No items resolved from {args.item_names_file}")
+                sys.exit(1)
         else:
             id_strings = [s.strip() for s in args.item_id.split(",")]
             try:
@@ -310,6 +366,15 @@ def main() -> None:
                 terminal.error(f"Invalid item ID format: {e}")
                 sys.exit(1)
 
+        if len(item_ids) > 1:
+            if indexes is None:
+                indexes = api.load_name_indexes(cache)
+            pending_ids = [
+                item_id
+                for item_id in item_ids
+                if args.overwrite or not (Path("data/items") / f"{item_id}.yaml").exists()
+            ]
+            prefetch_extractions(pending_ids, cache, model=args.model)
         failed_items = []
         for i, item_id in enumerate(item_ids):
             if len(item_ids) > 1:
@@ -323,6 +388,7 @@ def main() -> None:
                     dry_run=args.dry_run,
                     model=args.model,
                     strict=args.strict,
+                    indexes=indexes,
                 )
             except MultipleItemMatchError as e:
                 _handle_multiple_matches_interactive(e.name, e.item_ids, cache)
@@ -10,6 +10,7 @@ Features:
 - Configurable limit on number of new items to process per run
 - Progress reporting with count of remaining unresolved items
 - Clean Ctrl+C handling for safe interruption
+- Items started together share batched LLM extraction calls
 
 IMPORTANT: --dry-run mode will only process the root item and will not
 traverse its children, since no files are written to discover dependencies.
@@ -18,23 +19,26 @@ Use --dry-run only for previewing a single item's data.
 
 import argparse
 import logging
+import os
 import signal
 import subprocess
 import sys
 import threading
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
-import yaml
-
-from gw2_data import api, terminal
+from gw2_data import api, terminal, wiki, yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import APIError, ExtractionError, WikiError
-from scripts.populate import populate_item
+from gw2_data.types import NameIndexes
+from scripts.populate import populate_item, prefetch_extractions
 
 ITEMS_DIR = Path("data/items")
+_BULK_BATCH_SIZE = 200
+
+_ChildIndex = dict[int, tuple[tuple[int, int], set[int], list[str]]]
 
 _interrupted = False
 _state_lock = threading.Lock()
@@ -49,42 +53,63 @@ def _handle_sigint(signum: int, frame: object) -> None:
 
 
 def _get_existing_item_ids() -> set[int]:
-    ids: set[int] = set()
-    for path in ITEMS_DIR.glob("*.yaml"):
-        try:
-            ids.add(int(path.stem))
-        except ValueError:
-            continue
-    return ids
+    if not ITEMS_DIR.is_dir():
+        return set()
+    with os.scandir(ITEMS_DIR) as entries:
+        stems = [entry.name[:-5] for entry in entries if entry.name.endswith(".yaml")]
+    return {int(stem) for stem in stems if stem.isdecimal()}
+
 
+def _analyze_item_file(item_id: int, child_index: _ChildIndex) -> tuple[set[int], list[str]]:
+    """
+    Return the required item ids and 'other' notes of an item file.
 
-def _analyze_item_file(item_id: int) -> tuple[set[int], list[str]]:
+    Results are kept in child_index keyed by the file's mtime and size, so
+    unchanged files are only parsed once across runs.
+    """
     path = ITEMS_DIR / f"{item_id}.yaml"
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return set(), []
 
-    data = yaml.safe_load(path.read_text())
-    item_ids: set[int] = set()
-    other_notes: list[str] = []
-
-    for acq in data.get("acquisitions", []):
-        if acq.get("type") == "other":
-            notes = (acq.get("metadata") or {}).get("notes", "no description")
-            other_notes.append(notes)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = child_index.get(item_id)
+    if cached is not None and cached[0] == file_key:
+        return cached[1], cached[2]
+
+    acquisitions = yaml_io.load(path.read_bytes()).get("acquisitions") or []
+    item_ids = {
+        req["itemId"]
+        for acq in acquisitions
+        for req in acq.get("requirements") or ()
+        if "itemId" in req
+    }
+    other_notes = [
+        (acq.get("metadata") or {}).get("notes", "no description")
+        for acq in acquisitions
+        if acq.get("type") == "other"
+    ]
+
+    child_index[item_id] = (file_key, item_ids, other_notes)
+    return item_ids, other_notes
 
-        for req in acq.get("requirements", []):
-            if "itemId" in req:
-                item_ids.add(req["itemId"])
 
-    return item_ids, other_notes
+def _prefetch_api_items(item_ids: list[int], cache: CacheClient) -> None:
+    """Warm the API cache for newly queued items, 200 ids per request."""
+    for start in range(0, len(item_ids), _BULK_BATCH_SIZE):
+        try:
+            api.get_items_bulk(item_ids[start : start + _BULK_BATCH_SIZE], cache)
+        except APIError as e:
+            terminal.warning(f"Bulk prefetch failed, falling back to single lookups: {e}")
 
 
 def _play_completion_sound() -> None:
     try:
-        subprocess.run(
+        subprocess.Popen(
             ["afplay", "/System/Library/Sounds/Glass.aiff"],
-            check=False,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except Exception:
         pass
@@ -95,7 +120,7 @@ def _display_error_details(item_id: int, error_msg: str, cache: CacheClient) ->
     try:
         item = api.get_item(item_id, cache)
         item_name = item.get("name", "Unknown")
-        wiki_url = f"https://wiki.guildwars2.com/wiki/{item_name.replace(' ', '_')}"
+        wiki_url = wiki.page_url(item_name)
         terminal.info(f"    Wiki: {wiki_url}")
     except Exception:
         pass
@@ -116,9 +141,11 @@ def populate_tree(
     _interrupted = False
 
     existing = set[int]() if force else _get_existing_item_ids()
+    child_index: _ChildIndex = cache.get_item_children() or {}
 
     queue: deque[int] = deque()
     seen: set[int] = set()
+    unfetched: list[int] = []
     queued_new = 0
 
     def enqueue(item_id: int) -> None:
@@ -129,45 +156,36 @@ def populate_tree(
                 queue.append(item_id)
                 if item_id not in existing:
                     queued_new += 1
+                    unfetched.append(item_id)
 
-    def _skip_existing() -> None:
-        nonlocal skipped
-        while queue and queue[0] in existing:
-            item_id = queue.popleft()
-            child_ids, notes_list = _analyze_item_file(item_id)
+    def _drain_batch(in_flight: int) -> list[int]:
+        nonlocal queued_new, skipped
+        batch: list[int] = []
+        slots = workers - in_flight
+        if limit is not None:
+            slots = min(slots, limit - processed - in_flight)
+        while queue:
+            item_id = queue[0]
+            if item_id not in existing:
+                if len(batch) >= slots:
+                    break
+                queue.popleft()
+                queued_new -= 1
+                batch.append(item_id)
+                continue
+            queue.popleft()
+            child_ids, notes_list = _analyze_item_file(item_id, child_index)
             for cid in child_ids:
                 if cid not in seen:
                     enqueue(cid)
             for notes in notes_list:
                 other_types.append((item_id, notes))
             skipped += 1
-
-    def _drain_batch() -> list[int]:
-        nonlocal queued_new, skipped
-        batch: list[int] = []
-        remaining = (limit - processed) if limit is not None else None
-        while queue and len(batch) < workers:
-            if remaining is not None and len(batch) >= remaining:
-                break
-            item_id = queue.popleft()
-            if item_id in existing:
-                child_ids, notes_list = _analyze_item_file(item_id)
-                new_children = 0
-                for cid in child_ids:
-                    if cid not in seen:
-                        enqueue(cid)
-                        new_children += 1
-                for notes in notes_list:
-                    other_types.append((item_id, notes))
-                skipped += 1
-                continue
-            queued_new -= 1
-            batch.append(item_id)
         return batch
 
     def _handle_result(item_id: int) -> None:
         nonlocal processed
-        child_ids, notes_list = _analyze_item_file(item_id)
+        child_ids, notes_list = _analyze_item_file(item_id, child_index)
         new_children = 0
         for cid in child_ids:
             if cid not in seen:
@@ -189,39 +207,71 @@ def populate_tree(
     errors: list[tuple[int, str]] = []
     other_types: list[tuple[int, str]] = []
 
+    indexes: NameIndexes | None = None
+
     def _run_item(iid: int) -> None:
         with terminal.buffered():
-            populate_item(iid, cache, overwrite=force, dry_run=dry_run, model=model)
-
-    _skip_existing()
-
-    while queue and not _interrupted:
-        if limit is not None and processed >= limit:
-            break
+            populate_item(
+                iid, cache, overwrite=force, dry_run=dry_run, model=model, indexes=indexes
+            )
 
-        batch = _drain_batch()
-        if not batch:
-            break
+    def _prefetch(batch: list[int]) -> None:
+        with terminal.buffered():
+            prefetch_extractions(batch, cache, model=model)
 
+    def _submit(batch: list[int]) -> None:
         with _state_lock:
-            current_processed = processed
+            started = processed + len(in_flight)
             current_queued = queued_new
         batch_ids = ", ".join(str(i) for i in batch)
         if limit is not None:
             terminal.progress(
-                current_processed + len(batch),
+                started + len(batch),
                 limit,
                 f"Processing {batch_ids} ({current_queued} queued)",
             )
         else:
-            terminal.info(
-                f"\n[{current_processed + 1}] Processing {batch_ids} ({current_queued} queued)"
-            )
+            terminal.info(f"\n[{started + 1}] Processing {batch_ids} ({current_queued} queued)")
+        for item_id in batch:
+            in_flight[executor.submit(_run_item, item_id)] = item_id
+
+    in_flight: dict[Future[None], int] = {}
+    prefetching: dict[Future[None], list[int]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            if not _interrupted:
+                if unfetched:
+                    _prefetch_api_items(unfetched, cache)
+                    unfetched.clear()
+                reserved = sum(len(b) for b in prefetching.values())
+                batch = _drain_batch(len(in_flight) + reserved)
+                if batch:
+                    if indexes is None:
+                        indexes = api.load_name_indexes(cache)
+                    if len(batch) > 1:
+                        prefetching[executor.submit(_prefetch, batch)] = batch
+                    else:
+                        _submit(batch)
+
+            if not in_flight and not prefetching:
+                break
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_run_item, item_id): item_id for item_id in batch}
-            for future in as_completed(futures):
-                item_id = futures[future]
+            done, _ = wait([*in_flight, *prefetching], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in prefetching:
+                    batch = prefetching.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        terminal.warning(f"Extraction prefetch failed: {e}")
+                    if _interrupted:
+                        queue.extendleft(reversed(batch))
+                        queued_new += len(batch)
+                    else:
+                        _submit(batch)
+                    continue
+
+                item_id = in_flight.pop(future)
                 try:
                     future.result()
                     _handle_result(item_id)
@@ -232,8 +282,7 @@ def populate_tree(
                     errors.append((item_id, str(e)))
                     terminal.error(f"Unexpected error processing item {item_id}: {e}")
 
-        _skip_existing()
-
+    cache.set_item_children(child_index)
     remaining_total = len(queue)
 
     terminal.section_header("Tree Traversal Summary")
@@ -321,7 +370,7 @@ def main() -> None:
         root_ids: list[int] = []
 
         if args.item_name:
-            index = api.load_item_name_index()
+            index = api.load_item_name_index(cache)
             cleaned_name = api.clean_name(args.item_name)
             matches = index.get(cleaned_name)
             if not matches:
@@ -356,6 +405,9 @@ def main() -> None:
             workers=args.workers,
         )
 
+    except APIError as e:
+        terminal.error(str(e))
+        sys.exit(1)
     except KeyboardInterrupt:
         terminal.warning("\nAborted.")
         sys.exit(1)
@@ -18,7 +18,7 @@ from urllib.parse import quote
 
 import yaml
 
-from gw2_data import terminal, wiki
+from gw2_data import terminal, wiki, yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import WikiError
@@ -46,7 +46,7 @@ def _collect_vendor_names() -> list[str]:
     names: set[str] = set()
     for path in sorted(_ITEMS_DIR.glob("*.yaml")):
         with path.open() as f:
-            item_data = yaml.safe_load(f)
+            item_data = yaml_io.load(f)
         for acq in item_data.get("acquisitions", []):
             if acq.get("type") == "vendor":
                 name = acq.get("vendorName")
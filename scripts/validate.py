@@ -8,6 +8,7 @@ import yaml
 from jsonschema import Draft202012Validator
 from pydantic import ValidationError as PydanticValidationError
 
+from src.gw2_data import yaml_io
 from src.gw2_data.models import ItemFile
 
 REPO_ROOT = Path(__file__).parent.parent
@@ -25,7 +26,7 @@ def validate_file(filepath: Path, validator: Draft202012Validator) -> list[str]:
 
     try:
         with open(filepath) as f:
-            data = yaml.safe_load(f)
+            data = yaml_io.load(f)
     except yaml.YAMLError as e:
         errors.append(f"YAML parse error: {e}")
         return errors
@@ -0,0 +1,204 @@
+"""
+Rule-based extraction of acquisition entries from GW2 wiki pages.
+
+"Gathered from" and "Contained in" sections are rendered from Semantic
+MediaWiki list templates, so pages whose only acquisition content is those
+lists can be read directly instead of asking the LLM. Anything else in the
+acquisition sections (recipe boxes, vendor tables, prose, unknown status
+tags, item variants, generic containers, unrecognized sections) makes the
+page unsupported and the caller falls back to LLM extraction.
+
+Entries have the same shape as LLM extraction entries, so they go through
+the resolver unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from gw2_data import wiki
+
+log = logging.getLogger(__name__)
+
+_ACQUISITION_SECTION_IDS = frozenset(
+    {
+        "Acquisition",
+        "Sold_by",
+        "Vendor",
+        "Recipe",
+        "Recipes",
+        "Contained_in",
+        "Gathered_from",
+        "Salvaged_from",
+        "Reward_tracks",
+        "Used_in",
+    }
+)
+_LIST_SECTIONS: dict[str, str] = {
+    "Gathered_from": "gathered_from",
+    "Contained_in": "contained_in",
+}
+_SUBSECTIONS: dict[str, str] = {"Guaranteed": "guaranteed", "Chance": "chance"}
+_ROW_STATUSES = frozenset({"guaranteed", "chance", "choice", "historical"})
+_HEADING_LEVELS: dict[str, int] = {f"h{level}": level for level in range(1, 7)}
+_QUANTITY_RE = re.compile(r"\((\d+)(?:\s*[-–,]\s*(\d+))?\)")
+# Generic containers ("Unidentified Gear", "Chest of Exotic Equipment") are
+# excluded by the extraction prompt; the LLM decides which ones those are.
+_GENERIC_CONTAINER_RE = re.compile(
+    r"^Unidentified\b|\b(?:Basic|Fine|Masterwork|Rare|Exotic|Ascended) "
+    r"(?:Equipment|Gear|Weapons?|Armor|Trinkets?)\b"
+)
+
+
+class _UnsupportedMarkupError(Exception):
+    pass
+
+
+def _heading_id(heading: Tag) -> str | None:
+    anchor = heading.find(id=True)
+    if not isinstance(anchor, Tag):
+        return None
+    return str(anchor["id"])
+
+
+def _section_content(heading: Tag) -> list[Tag]:
+    level = _HEADING_LEVELS[heading.name]
+    content: list[Tag] = []
+    for sibling in heading.next_siblings:
+        if isinstance(sibling, NavigableString):
+            if sibling.strip():
+                raise _UnsupportedMarkupError(f"prose under '{_heading_id(heading)}'")
+            continue
+        if not isinstance(sibling, Tag):
+            continue
+        sibling_level = _HEADING_LEVELS.get(sibling.name)
+        if sibling_level is not None and sibling_level <= level:
+            break
+        content.append(sibling)
+    return content
+
+
+def _is_smw_list(tag: Tag) -> bool:
+    return tag.name == "ul" and "smw-format" in tag.get_attribute_list("class")
+
+
+def _check_acquisition_section(heading: Tag) -> None:
+    for tag in _section_content(heading):
+        if tag.name in _HEADING_LEVELS:
+            heading_id = _heading_id(tag)
+            if heading_id not in _LIST_SECTIONS and heading_id not in _SUBSECTIONS:
+                raise _UnsupportedMarkupError(f"unsupported subsection '{heading_id}'")
+        elif not _is_smw_list(tag):
+            raise _UnsupportedMarkupError(f"unsupported <{tag.name}> in Acquisition")
+
+
+def _parse_row(row: Tag, wiki_section: str, subsection: str | None) -> dict[str, Any] | None:
+    link = next((a for a in row.find_all("a") if a.get_text(strip=True)), None)
+    if link is None:
+        raise _UnsupportedMarkupError("list row without a named link")
+    link_text = link.get_text(" ", strip=True)
+
+    statuses = [small.get_text(strip=True).strip("()").lower() for small in row.find_all("small")]
+    unknown = [status for status in statuses if status not in _ROW_STATUSES]
+    if unknown:
+        raise _UnsupportedMarkupError(f"unknown status tag '{unknown[0]}' for '{link_text}'")
+    if "historical" in statuses:
+        return None
+    status = subsection or (statuses[0] if statuses else "guaranteed")
+    if status == "chance":
+        return None
+
+    name = link_text.replace("_", " ")
+    if wiki_section == "contained_in" and _GENERIC_CONTAINER_RE.search(name):
+        raise _UnsupportedMarkupError(f"generic container '{name}'")
+
+    entry: dict[str, Any] = {
+        "name": name,
+        "wikiSection": wiki_section,
+        "confidence": 1.0,
+        "quantity": 1,
+    }
+
+    tail = row.get_text(" ", strip=True).partition(link_text)[2]
+    match = _QUANTITY_RE.search(tail)
+    if match:
+        low = int(match.group(1))
+        high = int(match.group(2)) if match.group(2) else low
+        entry["quantity"] = low
+        if high != low:
+            entry["quantityMin"] = low
+            entry["quantityMax"] = high
+
+    if wiki_section == "contained_in":
+        if subsection == "guaranteed":
+            entry["wikiSubsection"] = "guaranteed"
+            return entry
+        entry["wikiSubsection"] = "inline"
+
+    entry["guaranteed"] = status == "guaranteed"
+    entry["choice"] = status == "choice"
+    return entry
+
+
+def _parse_list_section(heading: Tag, wiki_section: str) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+    subsection: str | None = None
+    for tag in _section_content(heading):
+        if tag.name in _HEADING_LEVELS:
+            heading_id = _heading_id(tag) or ""
+            if heading_id not in _SUBSECTIONS:
+                raise _UnsupportedMarkupError(f"unsupported subsection '{heading_id}'")
+            subsection = _SUBSECTIONS[heading_id]
+            continue
+        if not _is_smw_list(tag):
+            raise _UnsupportedMarkupError(f"unsupported <{tag.name}> in {wiki_section}")
+        for row in tag.find_all("li"):
+            entry = _parse_row(row, wiki_section, subsection)
+            if entry is not None:
+                entries.append(entry)
+    return entries
+
+
+def _extract(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    if soup.select_one(".recipe-box, table.npc"):
+        raise _UnsupportedMarkupError("recipe box or vendor table")
+
+    anchor_ids = {str(tag["id"]) for tag in soup.find_all(id=True)}
+    if "Variants" in anchor_ids:
+        raise _UnsupportedMarkupError("item variants")
+    unsupported = (anchor_ids & _ACQUISITION_SECTION_IDS) - {"Acquisition", *_LIST_SECTIONS}
+    if unsupported:
+        raise _UnsupportedMarkupError(f"sections {sorted(unsupported)}")
+    if not anchor_ids & _LIST_SECTIONS.keys():
+        raise _UnsupportedMarkupError("no list sections")
+
+    entries: list[dict[str, Any]] = []
+    for heading in soup.find_all(list(_HEADING_LEVELS)):
+        heading_id = _heading_id(heading)
+        if heading_id == "Acquisition":
+            _check_acquisition_section(heading)
+        elif heading_id in _LIST_SECTIONS:
+            entries.extend(_parse_list_section(heading, _LIST_SECTIONS[heading_id]))
+        elif heading_id not in _SUBSECTIONS and heading_id not in wiki._NON_ACQUISITION_SECTION_IDS:
+            # Same rule as wiki.has_acquisition_content: an unrecognized
+            # section may hold acquisition content, so leave the page to the LLM.
+            raise _UnsupportedMarkupError(f"unrecognized section '{heading_id}'")
+    return entries
+
+
+def extract_entries(html: str) -> list[dict[str, Any]] | None:
+    """
+    Extract entries from a page made only of acquisition list templates.
+
+    Returns None when the page has any acquisition content the rules do not
+    cover, so the whole page should go to the LLM instead.
+    """
+    try:
+        return _extract(BeautifulSoup(html, "html.parser"))
+    except _UnsupportedMarkupError as e:
+        log.debug("Rule-based extraction not applicable: %s", e)
+        return None
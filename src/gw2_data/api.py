@@ -3,7 +3,8 @@ GW2 API client for fetching item and recipe data.
 
 Wraps the official GW2 API (api.guildwars2.com/v2) with caching and
 error handling. All responses are cached indefinitely since game data
-rarely changes.
+rarely changes. Requests share one httpx.Client so cache misses reuse
+keep-alive connections instead of opening a new TLS session each time.
 
 Endpoints used:
   GET /v2/items              → list all item IDs
@@ -15,22 +16,26 @@ Endpoints used:
 See https://wiki.guildwars2.com/wiki/API:2 for full API documentation.
 """
 
+import hashlib
 import logging
 import re
+from collections.abc import Callable
 from pathlib import Path
 
 import httpx
-import yaml
 
+from gw2_data import yaml_io
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import APIError, MultipleItemMatchError
-from gw2_data.types import BulkResult, GW2Item, GW2Recipe
+from gw2_data.types import BulkResult, GW2Item, GW2Recipe, NameIndexes
 
 log = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.guildwars2.com/v2"
 _CONFIG_DIR = Path(__file__).parent / "overrides"
+_WHITESPACE_RE = re.compile(r"\s+")
+_client = httpx.Client()
 
 
 def get_item(item_id: int, cache: CacheClient) -> GW2Item:
@@ -45,7 +50,7 @@ def get_item(item_id: int, cache: CacheClient) -> GW2Item:
     log.info("Item %d: fetching from GW2 API", item_id)
     settings = get_settings()
     try:
-        response = httpx.get(f"{_BASE_URL}/items/{item_id}", timeout=settings.api_timeout)
+        response = _client.get(f"{_BASE_URL}/items/{item_id}", timeout=settings.api_timeout)
         response.raise_for_status()
     except httpx.HTTPStatusError as e:
         raise APIError(f"Failed to fetch item {item_id}: HTTP {e.response.status_code}") from e
@@ -69,7 +74,7 @@ def get_recipe(recipe_id: int, cache: CacheClient) -> GW2Recipe:
     log.info("Recipe %d: fetching from GW2 API", recipe_id)
     settings = get_settings()
     try:
-        response = httpx.get(f"{_BASE_URL}/recipes/{recipe_id}", timeout=settings.api_timeout)
+        response = _client.get(f"{_BASE_URL}/recipes/{recipe_id}", timeout=settings.api_timeout)
         response.raise_for_status()
     except httpx.HTTPStatusError as e:
         raise APIError(f"Failed to fetch recipe {recipe_id}: HTTP {e.response.status_code}") from e
@@ -93,7 +98,7 @@ def search_recipes_by_output(item_id: int, cache: CacheClient) -> list[int]:
     log.info("Recipe search for item %d: fetching from GW2 API", item_id)
     settings = get_settings()
     try:
-        response = httpx.get(
+        response = _client.get(
             f"{_BASE_URL}/recipes/search",
             params={"output": item_id},
             timeout=settings.api_timeout,
@@ -115,7 +120,7 @@ def get_all_item_ids() -> list[int]:
     log.info("Fetching all item IDs from GW2 API")
     settings = get_settings()
     try:
-        response = httpx.get(f"{_BASE_URL}/items", timeout=settings.api_timeout)
+        response = _client.get(f"{_BASE_URL}/items", timeout=settings.api_timeout)
         response.raise_for_status()
     except httpx.HTTPStatusError as e:
         raise APIError(f"Failed to fetch item IDs: HTTP {e.response.status_code}") from e
@@ -127,7 +132,19 @@ def get_all_item_ids() -> list[int]:
     return item_ids
 
 
-def get_items_bulk(item_ids: list[int], cache: CacheClient, *, force: bool = False) -> BulkResult:
+def get_items_bulk(
+    item_ids: list[int],
+    cache: CacheClient,
+    *,
+    force: bool = False,
+    before_request: Callable[[], None] | None = None,
+) -> BulkResult:
+    """
+    Fetch up to 200 items, from the cache when every id is cached.
+
+    before_request is called right before an HTTP request is sent, so
+    callers can rate-limit API traffic without slowing down cache hits.
+    """
     if not item_ids:
         return BulkResult(items=[], from_cache=True)
     if len(item_ids) > 200:
@@ -148,10 +165,12 @@ def get_items_bulk(item_ids: list[int], cache: CacheClient, *, force: bool = Fal
             return BulkResult(items=cached_items, from_cache=True)
 
     log.debug("Batch of %d items: fetching from API", len(item_ids))
+    if before_request is not None:
+        before_request()
     settings = get_settings()
     ids_param = ",".join(str(i) for i in item_ids)
     try:
-        response = httpx.get(
+        response = _client.get(
             f"{_BASE_URL}/items", params={"ids": ids_param}, timeout=settings.api_timeout
         )
         response.raise_for_status()
@@ -167,10 +186,17 @@ def get_items_bulk(item_ids: list[int], cache: CacheClient, *, force: bool = Fal
 
 
 def clean_name(name: str) -> str:
-    return re.sub(r"\s+", " ", name.replace("\n", " ").replace("\r", " ")).strip()
+    return _WHITESPACE_RE.sub(" ", name).strip()
+
 
+def load_item_name_index(cache: CacheClient | None = None) -> dict[str, list[int]]:
+    """
+    Load the item name index with name overrides applied.
 
-def load_item_name_index() -> dict[str, list[int]]:
+    With a cache, the merged index is snapshotted keyed by a hash of the
+    index and override files, so later runs unpickle it instead of parsing
+    the large YAML index again.
+    """
     index_path = Path("data/index/item_names.yaml")
     override_path = _CONFIG_DIR / "item_name_overrides.yaml"
 
@@ -180,15 +206,22 @@ def load_item_name_index() -> dict[str, list[int]]:
             "Run 'uv run python -m scripts.build_index' first."
         )
 
-    with index_path.open() as f:
-        index: dict[str, list[int]] = yaml.safe_load(f)
+    index_bytes = index_path.read_bytes()
+    override_bytes = override_path.read_bytes() if override_path.exists() else b""
+    content_hash = hashlib.sha256(index_bytes + b"\0" + override_bytes).hexdigest()
 
-    if override_path.exists():
-        with override_path.open() as f:
-            overrides: dict[str, int] = yaml.safe_load(f) or {}
-        for name, item_id in overrides.items():
-            index[name] = [item_id]
+    if cache is not None:
+        cached = cache.get_name_index("item_names", content_hash)
+        if cached is not None:
+            return cached
+
+    index: dict[str, list[int]] = yaml_io.load(index_bytes)
+    overrides: dict[str, int] = yaml_io.load(override_bytes) or {}
+    for name, item_id in overrides.items():
+        index[name] = [item_id]
 
+    if cache is not None:
+        cache.set_name_index("item_names", content_hash, index)
     return index
 
 
@@ -203,11 +236,11 @@ def load_currency_name_index() -> dict[str, int]:
         )
 
     with index_path.open() as f:
-        index: dict[str, int] = yaml.safe_load(f)
+        index: dict[str, int] = yaml_io.load(f)
 
     if override_path.exists():
         with override_path.open() as f:
-            overrides: dict[str, int] = yaml.safe_load(f) or {}
+            overrides: dict[str, int] = yaml_io.load(f) or {}
         index.update(overrides)
 
     return index
@@ -223,17 +256,25 @@ def load_gathering_node_index() -> set[str]:
         )
 
     with index_path.open() as f:
-        nodes: list[str] = yaml.safe_load(f)
+        nodes: list[str] = yaml_io.load(f)
 
     return {clean_name(n) for n in nodes}
 
 
+def load_name_indexes(cache: CacheClient | None = None) -> NameIndexes:
+    return NameIndexes(
+        items=load_item_name_index(cache),
+        currencies=load_currency_name_index(),
+        gathering_nodes=load_gathering_node_index(),
+    )
+
+
 def load_wiki_page_overrides() -> dict[int, str]:
     override_path = _CONFIG_DIR / "wiki_page_overrides.yaml"
     if not override_path.exists():
         return {}
     with override_path.open() as f:
-        overrides: dict[int, str] = yaml.safe_load(f) or {}
+        overrides: dict[int, str] = yaml_io.load(f) or {}
     return overrides
 
 
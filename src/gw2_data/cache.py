@@ -2,9 +2,10 @@
 Cache layer for GW2 API and wiki data using diskcache.
 
 Provides persistent caching across script invocations to minimize
-API calls, wiki fetches, and LLM processing costs. Cache is stored
-in a configurable directory and organized by tags (api, wiki, llm)
-for selective clearing.
+API calls, wiki fetches, and LLM processing costs, plus parsed snapshots
+of the large name index files and of each item file's requirements.
+Cache is stored in a configurable directory and organized by tags (api,
+wiki, llm, index) for selective clearing.
 """
 
 from pathlib import Path
@@ -59,6 +60,21 @@ class CacheClient:
             tag="llm",
         )
 
+    def get_name_index(self, name: str, content_hash: str) -> dict | None:
+        cached = self._cache.get(f"index:{name}")
+        if cached is None or cached[0] != content_hash:
+            return None
+        return cached[1]
+
+    def set_name_index(self, name: str, content_hash: str, index: dict) -> None:
+        self._cache.set(f"index:{name}", (content_hash, index), expire=None, tag="index")
+
+    def get_item_children(self) -> dict | None:
+        return self._cache.get("index:item_children")
+
+    def set_item_children(self, index: dict) -> None:
+        self._cache.set("index:item_children", index, expire=None, tag="index")
+
     def clear_cache(self, tags: list[str] | None = None) -> None:
         if tags:
             for tag in tags:
@@ -0,0 +1,50 @@
+"""
+HTML parsing for the GW2 wiki "Gathering" page.
+
+Extracts resource node names (harvesting, logging, mining and special
+nodes) from the node tables on the rendered page. Each node table has a
+leftmost "Node" or "Node name" column whose cell links to the node page.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from bs4 import BeautifulSoup, Tag
+
+log = logging.getLogger(__name__)
+
+_NODE_COLUMN_HEADERS = frozenset({"node", "node name"})
+
+
+def _is_node_table(table: Tag) -> bool:
+    header = table.find("th")
+    if not isinstance(header, Tag):
+        return False
+    return header.get_text(" ", strip=True).lower() in _NODE_COLUMN_HEADERS
+
+
+def _node_name_from_row(row: Tag) -> str | None:
+    cell = row.find("td")
+    if not isinstance(cell, Tag):
+        return None
+    link = cell.find("a", string=True)
+    source = link if isinstance(link, Tag) else cell
+    name = source.get_text(" ", strip=True)
+    return name or None
+
+
+def extract_gathering_nodes(html: str) -> list[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    names: dict[str, None] = {}
+
+    for table in soup.find_all("table"):
+        if not isinstance(table, Tag) or not _is_node_table(table):
+            continue
+        for row in table.find_all("tr"):
+            name = _node_name_from_row(row)
+            if name:
+                names[name] = None
+
+    log.info("Found %d gathering node names", len(names))
+    return list(names)
@@ -3,19 +3,36 @@ import json
 import logging
 import re
 import subprocess
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-from gw2_data import wiki
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from gw2_data import acquisition_scraper, wiki
 from gw2_data.cache import CacheClient
 from gw2_data.config import get_settings
 from gw2_data.exceptions import ExtractionError
+from gw2_data.models import BatchExtractionItem, ExtractionResponse
 from gw2_data.types import GW2Item
-from prompts.extract_acquisitions import SYSTEM_PROMPT, build_user_prompt
+from prompts.extract_acquisitions import (
+    EXAMPLES,
+    PROMPT_HASH,
+    SYSTEM_PROMPT,
+    build_batch_item_prompt,
+    build_batch_user_prompt,
+    build_examples_section,
+    build_user_prompt,
+    select_examples,
+)
 
 log = logging.getLogger(__name__)
 
 _CONTENT_HASH_LENGTH = 16
-_PROMPT_HASH = hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()[:_CONTENT_HASH_LENGTH]
+_CLI_TIMEOUT_SECONDS = 120
+_MAX_BATCH_ITEMS = 8
+_EXAMPLE_SIZES = {name: len(build_examples_section([name])) for name in EXAMPLES}
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?(.*?)\n?\s*```$", re.DOTALL)
 
 
 @dataclass
@@ -26,44 +43,58 @@ class ExtractionResult:
     notes: str | None
 
 
-def _parse_llm_response(text: str) -> dict:
+@dataclass
+class ExtractionRequest:
+    item_id: int
+    item_name: str
+    wiki_html: str
+    api_data: GW2Item
+
+
+def _parse_llm_response(text: str, schema: type[BaseModel] = ExtractionResponse) -> dict:
     cleaned = text.strip()
-    match = re.match(r"^```(?:json)?\s*\n?(.*?)\n?\s*```$", cleaned, re.DOTALL)
+    match = _CODE_FENCE_RE.match(cleaned)
     if match:
         cleaned = match.group(1).strip()
     try:
-        return json.loads(cleaned)
+        parsed = json.loads(cleaned)
     except json.JSONDecodeError as e:
         raise ExtractionError(f"Failed to parse LLM response as JSON: {e}") from e
+    try:
+        validated = schema.model_validate(parsed)
+    except PydanticValidationError as e:
+        raise ExtractionError(f"LLM response does not match extraction schema: {e}") from e
+    return validated.model_dump(by_alias=True, exclude_none=True)
 
 
-def _call_llm(
-    item_id: int,
-    item_name: str,
-    item_type: str,
-    rarity: str,
-    wiki_html: str,
-    model: str | None = None,
-) -> dict:
-    settings = get_settings()
+def _parse_batch_lines(text: str) -> Iterator[dict]:
+    cleaned = text.strip()
+    match = _CODE_FENCE_RE.match(cleaned)
+    if match:
+        cleaned = match.group(1)
+    for line in cleaned.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield _parse_llm_response(line, schema=BatchExtractionItem)
+        except ExtractionError as e:
+            log.warning("Skipping malformed line in LLM batch response: %s", e)
 
-    user_prompt = build_user_prompt(
-        item_id=item_id,
-        name=item_name,
-        item_type=item_type,
-        rarity=rarity,
-        wiki_html=wiki_html,
-    )
 
+def _run_claude(user_prompt: str, model: str, timeout: int = _CLI_TIMEOUT_SECONDS) -> str:
     cmd = [
         "claude",
         "--print",
         "--output-format",
         "text",
+        "--tools",
+        "",
+        "--strict-mcp-config",
         "--system-prompt",
         SYSTEM_PROMPT,
         "--model",
-        model or settings.llm_model,
+        model,
         "--no-session-persistence",
         "-",
     ]
@@ -74,7 +105,7 @@ def _call_llm(
             input=user_prompt,
             capture_output=True,
             text=True,
-            timeout=120,
+            timeout=timeout,
             check=False,
             cwd="/tmp",
         )
@@ -83,7 +114,7 @@ def _call_llm(
             "claude CLI not found. Install Claude Code: https://docs.anthropic.com/en/docs/claude-code"
         )
     except subprocess.TimeoutExpired:
-        raise ExtractionError("claude CLI timed out after 120 seconds")
+        raise ExtractionError(f"claude CLI timed out after {timeout} seconds")
 
     if result.returncode != 0:
         stderr = result.stderr.strip()
@@ -91,7 +122,74 @@ def _call_llm(
         details = stderr or stdout or "(no output)"
         raise ExtractionError(f"claude CLI failed (exit {result.returncode}): {details}")
 
-    return _parse_llm_response(result.stdout)
+    return result.stdout
+
+
+def _call_llm(
+    item_id: int,
+    item_name: str,
+    item_type: str,
+    rarity: str,
+    wiki_html: str,
+    model: str | None = None,
+) -> dict:
+    settings = get_settings()
+
+    user_prompt = build_user_prompt(
+        item_id=item_id,
+        name=item_name,
+        item_type=item_type,
+        rarity=rarity,
+        wiki_html=wiki_html,
+    )
+
+    return _parse_llm_response(_run_claude(user_prompt, model or settings.llm_model))
+
+
+def _prepare_html(wiki_html: str, model: str, rarity: str) -> tuple[str, str]:
+    html_limit = wiki.get_html_limit_for_model(model)
+    filtered_html = wiki.filter_variant_rows(wiki_html, rarity)
+    processed_html = wiki.extract_acquisition_sections(filtered_html, max_length=html_limit)
+
+    content_hash = hashlib.sha256(processed_html.encode()).hexdigest()[:_CONTENT_HASH_LENGTH]
+    return processed_html, f"{PROMPT_HASH}:{content_hash}"
+
+
+def _empty_result() -> ExtractionResult:
+    return ExtractionResult(
+        entries=[],
+        overall_confidence=1.0,
+        entry_confidences=[],
+        notes="No acquisition sections found on wiki page",
+    )
+
+
+def _rule_result(entries: list[dict]) -> ExtractionResult:
+    return ExtractionResult(
+        entries=entries,
+        overall_confidence=1.0,
+        entry_confidences=[e["confidence"] for e in entries],
+        notes="Extracted from wiki list templates without the LLM",
+    )
+
+
+def _result_from_cache_entry(cached: dict) -> ExtractionResult:
+    return ExtractionResult(
+        entries=cached["entries"],
+        overall_confidence=cached["overall_confidence"],
+        entry_confidences=cached["entry_confidences"],
+        notes=cached["notes"],
+    )
+
+
+def _cache_entry_from_output(llm_output: dict) -> dict:
+    entries = llm_output.get("entries", [])
+    return {
+        "entries": entries,
+        "overall_confidence": llm_output.get("overallConfidence", 0.0),
+        "entry_confidences": [e.get("confidence", 0.0) for e in entries],
+        "notes": llm_output.get("notes"),
+    }
 
 
 def extract_entries(
@@ -105,24 +203,24 @@ def extract_entries(
     settings = get_settings()
     effective_model = model or settings.llm_model
 
-    html_limit = wiki.get_html_limit_for_model(effective_model)
-    processed_html = wiki.extract_acquisition_sections(wiki_html, max_length=html_limit)
-
-    content_hash = hashlib.sha256(processed_html.encode()).hexdigest()[:_CONTENT_HASH_LENGTH]
-    cache_hash = f"{_PROMPT_HASH}:{content_hash}"
     rarity = api_data["rarity"]
+    processed_html, cache_hash = _prepare_html(wiki_html, effective_model, rarity)
+
+    if not wiki.has_acquisition_content(processed_html):
+        log.info("LLM extraction for '%s': no acquisition sections, skipping", item_name)
+        return _empty_result()
+
+    rule_entries = acquisition_scraper.extract_entries(processed_html)
+    if rule_entries is not None:
+        log.info("LLM extraction for '%s': page fully parsed by rules, skipping", item_name)
+        return _rule_result(rule_entries)
 
     cached = cache.get_llm_extraction(item_id, item_name, cache_hash, effective_model, rarity)
     if cached is not None:
         log.info(
             "LLM extraction for '%s': using cached result (model=%s)", item_name, effective_model
         )
-        return ExtractionResult(
-            entries=cached["entries"],
-            overall_confidence=cached["overall_confidence"],
-            entry_confidences=cached["entry_confidences"],
-            notes=cached["notes"],
-        )
+        return _result_from_cache_entry(cached)
 
     log.info("LLM extraction for '%s': calling claude CLI (model=%s)", item_name, effective_model)
     llm_output = _call_llm(
@@ -134,23 +232,139 @@ def extract_entries(
         model=effective_model,
     )
 
-    entries = llm_output.get("entries", [])
-    overall_confidence = llm_output.get("overallConfidence", 0.0)
-    notes = llm_output.get("notes")
+    cache_entry = _cache_entry_from_output(llm_output)
+    cache.set_llm_extraction(item_id, item_name, cache_hash, effective_model, rarity, cache_entry)
 
-    entry_confidences = [e.get("confidence", 0.0) for e in entries]
+    return _result_from_cache_entry(cache_entry)
 
-    cache_entry = {
-        "entries": entries,
-        "overall_confidence": overall_confidence,
-        "entry_confidences": entry_confidences,
-        "notes": notes,
-    }
-    cache.set_llm_extraction(item_id, item_name, cache_hash, effective_model, rarity, cache_entry)
 
-    return ExtractionResult(
-        entries=entries,
-        overall_confidence=overall_confidence,
-        entry_confidences=entry_confidences,
-        notes=notes,
-    )
+def _pack_batches(
+    item_prompts: dict[int, str],
+    budget: int,
+    max_items: int,
+    item_examples: dict[int, list[str]] | None = None,
+) -> list[list[int]]:
+    """
+    Greedily pack item prompts into batches of at most budget characters.
+
+    Largest prompts are placed first, each into the first batch with room
+    (first-fit decreasing), so small pages fill the gaps left by large ones.
+    A prompt larger than the budget gets a batch of its own. Examples from
+    item_examples are emitted once per batch, so each distinct example is
+    counted once against the batch it joins.
+    """
+    item_examples = item_examples or {}
+
+    def added_size(item_id: int, batch_examples: set[str]) -> int:
+        new_examples = set(item_examples.get(item_id, ())) - batch_examples
+        return len(item_prompts[item_id]) + sum(_EXAMPLE_SIZES[name] for name in new_examples)
+
+    batches: list[list[int]] = []
+    sizes: list[int] = []
+    examples: list[set[str]] = []
+    for item_id in sorted(item_prompts, key=lambda i: added_size(i, set()), reverse=True):
+        for index, batch in enumerate(batches):
+            size = added_size(item_id, examples[index])
+            if len(batch) < max_items and sizes[index] + size <= budget:
+                batch.append(item_id)
+                sizes[index] += size
+                examples[index].update(item_examples.get(item_id, ()))
+                break
+        else:
+            batches.append([item_id])
+            sizes.append(added_size(item_id, set()))
+            examples.append(set(item_examples.get(item_id, ())))
+    return batches
+
+
+def extract_entries_batch(
+    requests: list[ExtractionRequest],
+    cache: CacheClient,
+    model: str | None = None,
+    max_items_per_call: int = _MAX_BATCH_ITEMS,
+) -> dict[int, ExtractionResult]:
+    """
+    Extract entries for several items with as few claude CLI calls as possible.
+
+    Pages fully covered by the rule-based extractor and cached items never
+    reach the CLI. The remaining pages are packed into calls that stay
+    within the model's HTML limit, so CLI startup and the system prompt are
+    paid once per call rather than once per item. The model answers with
+    one JSON line per item, so a malformed line only loses that item. Items
+    missing from the response are missing from the returned mapping, so
+    callers can fall back to extract_entries for them.
+    """
+    settings = get_settings()
+    effective_model = model or settings.llm_model
+
+    results: dict[int, ExtractionResult] = {}
+    pending: dict[int, tuple[ExtractionRequest, str]] = {}
+    item_prompts: dict[int, str] = {}
+    item_examples: dict[int, list[str]] = {}
+
+    for request in requests:
+        rarity = request.api_data["rarity"]
+        processed_html, cache_hash = _prepare_html(request.wiki_html, effective_model, rarity)
+        if not wiki.has_acquisition_content(processed_html):
+            results[request.item_id] = _empty_result()
+            continue
+
+        rule_entries = acquisition_scraper.extract_entries(processed_html)
+        if rule_entries is not None:
+            results[request.item_id] = _rule_result(rule_entries)
+            continue
+
+        cached = cache.get_llm_extraction(
+            request.item_id, request.item_name, cache_hash, effective_model, rarity
+        )
+        if cached is not None:
+            results[request.item_id] = _result_from_cache_entry(cached)
+            continue
+
+        pending[request.item_id] = (request, cache_hash)
+        item_prompts[request.item_id] = build_batch_item_prompt(
+            item_id=request.item_id,
+            name=request.item_name,
+            item_type=request.api_data["type"],
+            rarity=rarity,
+            wiki_html=processed_html,
+        )
+        item_examples[request.item_id] = select_examples(processed_html)
+
+    budget = wiki.get_html_limit_for_model(effective_model)
+    for batch in _pack_batches(item_prompts, budget, max_items_per_call, item_examples):
+        log.info(
+            "LLM batch extraction for %d items: calling claude CLI (model=%s)",
+            len(batch),
+            effective_model,
+        )
+        output = _run_claude(
+            build_batch_user_prompt(
+                [item_prompts[item_id] for item_id in batch],
+                [name for item_id in batch for name in item_examples[item_id]],
+            ),
+            effective_model,
+            timeout=_CLI_TIMEOUT_SECONDS * len(batch),
+        )
+        for item_output in _parse_batch_lines(output):
+            item_id = item_output["itemId"]
+            if item_id not in batch or item_id not in pending:
+                log.warning("LLM batch extraction returned unrequested item %d", item_id)
+                continue
+
+            request, cache_hash = pending.pop(item_id)
+            cache_entry = _cache_entry_from_output(item_output)
+            cache.set_llm_extraction(
+                item_id,
+                request.item_name,
+                cache_hash,
+                effective_model,
+                request.api_data["rarity"],
+                cache_entry,
+            )
+            results[item_id] = _result_from_cache_entry(cache_entry)
+
+    for request, _ in pending.values():
+        log.warning("LLM batch extraction omitted '%s' (%d)", request.item_name, request.item_id)
+
+    return results
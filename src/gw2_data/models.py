@@ -256,6 +256,55 @@ class LocationEntry(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+# --- LLM Extraction ---
+
+WikiSection = Literal[
+    "recipe",
+    "vendor",
+    "achievement",
+    "gathered_from",
+    "contained_in",
+    "salvaged_from",
+    "reward_track",
+    "map_reward",
+    "wizards_vault",
+    "other",
+]
+
+
+class ExtractedIngredient(BaseModel):
+    name: str
+    quantity: int
+
+
+class ExtractedEntry(BaseModel):
+    name: str
+    wiki_section: WikiSection = Field(alias="wikiSection")
+    wiki_subsection: str | None = Field(default=None, alias="wikiSubsection")
+    confidence: float = Field(default=0.0, ge=0, le=1)
+    quantity: float = 1
+    quantity_min: float | None = Field(default=None, alias="quantityMin")
+    quantity_max: float | None = Field(default=None, alias="quantityMax")
+    guaranteed: bool | None = None
+    choice: bool | None = None
+    ingredients: list[ExtractedIngredient] | None = None
+    metadata: dict | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class ExtractionResponse(BaseModel):
+    entries: list[ExtractedEntry] = Field(default_factory=list)
+    overall_confidence: float = Field(default=0.0, alias="overallConfidence", ge=0, le=1)
+    notes: str | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class BatchExtractionItem(ExtractionResponse):
+    item_id: int = Field(alias="itemId")
+
+
 # --- Item File ---
 
 
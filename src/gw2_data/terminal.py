@@ -6,7 +6,8 @@ progress indicators, and structured error messages for the populate scripts.
 
 Thread safety: All print functions acquire _lock to prevent interleaved lines.
 For concurrent workers, use `buffered()` to capture an entire section of output
-and flush it atomically, preventing interleaved sections across threads.
+and flush it atomically, preventing interleaved sections across threads, or
+`captured()` to hand the section back so output can be written in input order.
 """
 
 import sys
@@ -60,18 +61,29 @@ def _print(*args: object, file: object = None, **kwargs: object) -> None:
 
 
 @contextmanager
-def buffered() -> Iterator[None]:
+def captured() -> Iterator[StringIO]:
     buf = StringIO()
     _thread_local.buffer = buf
     try:
-        yield
+        yield buf
     finally:
         _thread_local.buffer = None
-        output = buf.getvalue()
-        if output:
-            with _lock:
-                sys.stdout.write(output)
-                sys.stdout.flush()
+
+
+def write(output: str) -> None:
+    if output:
+        with _lock:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+
+
+@contextmanager
+def buffered() -> Iterator[None]:
+    with captured() as buf:
+        try:
+            yield
+        finally:
+            write(buf.getvalue())
 
 
 def colorize(text: str, *colors: Color) -> str:
@@ -41,3 +41,9 @@ class GW2Recipe(TypedDict):
 class BulkResult(NamedTuple):
     items: list[GW2Item]
     from_cache: bool
+
+
+class NameIndexes(NamedTuple):
+    items: dict[str, list[int]]
+    currencies: dict[str, int]
+    gathering_nodes: set[str]
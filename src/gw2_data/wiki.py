@@ -3,7 +3,7 @@ GW2 Wiki client for fetching item documentation.
 
 Wraps the GW2 Wiki MediaWiki API to fetch rendered HTML pages containing
 acquisition information. All pages are cached indefinitely to minimize
-load on the wiki servers.
+load on the wiki servers. Requests share one keep-alive httpx.Client.
 """
 
 import logging
@@ -20,8 +20,10 @@ from gw2_data.exceptions import WikiError
 log = logging.getLogger(__name__)
 
 _WIKI_API_URL = "https://wiki.guildwars2.com/api.php"
+_WIKI_PAGE_URL = "https://wiki.guildwars2.com/wiki/"
 _DEFAULT_HTML_LIMIT = 300_000
 MAX_REDIRECT_DEPTH = 5
+_client = httpx.Client()
 
 MODEL_HTML_LIMITS: dict[str, int] = {
     "haiku": 300_000,
@@ -37,16 +39,23 @@ def get_html_limit_for_model(model: str) -> int:
     return _DEFAULT_HTML_LIMIT
 
 
+def page_url(page_name: str) -> str:
+    return _WIKI_PAGE_URL + page_name.replace(" ", "_")
+
+
 def _fetch_wiki_page(page_name: str) -> str:
     settings = get_settings()
     try:
-        response = httpx.get(
+        response = _client.get(
             _WIKI_API_URL,
             params={
                 "action": "parse",
                 "page": page_name,
                 "prop": "text",
                 "format": "json",
+                "disableeditsection": "true",
+                "disabletoc": "true",
+                "disablelimitreport": "true",
             },
             timeout=settings.api_timeout,
         )
@@ -76,9 +85,13 @@ def _fetch_wiki_page(page_name: str) -> str:
 _DISAMBIG_MARKER = "Disambig_icon.png"
 
 
+_SERVER_REDIRECT_RE = re.compile(
+    r'<div[^>]*class="redirectMsg"[^>]*>.*?<a[^>]*href="/wiki/([^"]+)"', re.DOTALL | re.IGNORECASE
+)
+
+
 def _find_server_redirect(html: str) -> str | None:
-    redirect_pattern = r'<div[^>]*class="redirectMsg"[^>]*>.*?<a[^>]*href="/wiki/([^"]+)"'
-    match = re.search(redirect_pattern, html, re.DOTALL | re.IGNORECASE)
+    match = _SERVER_REDIRECT_RE.search(html)
     if not match:
         return None
 
@@ -148,6 +161,76 @@ def get_page_html(page_name: str, cache: CacheClient, _depth: int = 0) -> str:
     return html_content
 
 
+_VARIANTS_RE = re.compile(r'<span[^>]*id="Variants"[^>]*>', re.IGNORECASE)
+_ACQUISITION_MARKER_RE = re.compile(
+    r'id="(?:Acquisition|Sold_by|Vendor|Recipes?|Contained_in|Gathered_from|Salvaged_from|'
+    r'Reward_tracks|Used_in)"|class="(?:recipe-box|npc\b)',
+    re.IGNORECASE,
+)
+_HEADING_ID_RE = re.compile(r'<h[2-6]\b[^>]*>\s*<span[^>]*\bid="([^"]+)"', re.IGNORECASE)
+_NON_ACQUISITION_SECTION_IDS = frozenset(
+    {
+        "Currency_for",
+        "Dropped_by",
+        "External_links",
+        "Gallery",
+        "Guild_upgrades",
+        "Map_Bonus_Reward",
+        "Notes",
+        "Recipe_sheet",
+        "Rewarded_by",
+        "Salvage_results",
+        "Trivia",
+        "Variants",
+    }
+)
+_VENDOR_TABLE_RE = re.compile(
+    r'<table[^>]*class="[^"]*\bnpc\b[^"]*"[^>]*>.*?</table>', re.DOTALL | re.IGNORECASE
+)
+_TABLE_ROW_RE = re.compile(r"<tr\b[^>]*>.*?</tr>", re.DOTALL | re.IGNORECASE)
+_TABLE_CELL_RE = re.compile(r"<td\b", re.IGNORECASE)
+_CONTAINED_IN_SECTION_RE = re.compile(
+    r'<span[^>]*id="Contained_in"[^>]*>.*?(?=<h[1-3][ >]|$)', re.DOTALL | re.IGNORECASE
+)
+_LIST_ITEM_RE = re.compile(r"<li\b[^>]*>.*?</li>", re.DOTALL | re.IGNORECASE)
+_RARITY_CLASS_RE = re.compile(r'class="rarity-([a-z]+)"', re.IGNORECASE)
+_DEFAULT_VENDOR_ROW_RARITY = "ascended"
+
+_EXCLUDED_SECTION_PATTERNS = [
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r'<span[^>]*id="Dropped_by"[^>]*>.*?(?=<h[1-3][ >]|$)',
+        r'<span[^>]*id="Currency_for"[^>]*>.*?(?=<h[12][ >]|$)',
+        r'<span[^>]*id="Recipe_sheet"[^>]*>.*?(?=<h[1-3][ >]|$)',
+        r'<span[^>]*id="Salvage_results"[^>]*>.*?(?=<h[1-3][ >]|$)',
+        r'<span[^>]*id="Map_Bonus_Reward"[^>]*>.*?(?=<h[1-3][ >]|$)',
+        r'<span[^>]*id="Rewarded_by"[^>]*>.*?(?=<h[1-3][ >]|$)',
+        r'<span[^>]*id="Trivia"[^>]*>.*?(?=<h[12][ >]|$)',
+        r'<span[^>]*id="Gallery"[^>]*>.*?(?=<h[12][ >]|$)',
+        r'<span[^>]*id="Notes"[^>]*>.*?(?=<h[12][ >]|$)',
+        r'<span[^>]*id="External_links"[^>]*>.*?(?=<h[12][ >]|$)',
+        r'<span[^>]*id="Guild_upgrades"[^>]*>.*?(?=<h[12][ >]|$)',
+    )
+]
+_USED_IN_SECTION_RE = re.compile(
+    r'<span[^>]*id="Used_in"[^>]*>.*?(?=<h[12][ >]|$)', re.DOTALL | re.IGNORECASE
+)
+
+_MARKUP_NOISE_PATTERNS = [
+    re.compile(r"<!--.*?-->", re.DOTALL),
+    re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE),
+    re.compile(r'<sup[^>]*class="reference"[^>]*>.*?</sup>', re.DOTALL | re.IGNORECASE),
+    re.compile(r'\s(?:srcset|decoding|loading)="[^"]*"', re.IGNORECASE),
+]
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def compact_html(html: str) -> str:
+    for pattern in _MARKUP_NOISE_PATTERNS:
+        html = pattern.sub("", html)
+    return _WHITESPACE_RE.sub(" ", html).strip()
+
+
 def extract_acquisition_sections(html: str, max_length: int = _DEFAULT_HTML_LIMIT) -> str:
     """
     Extract only acquisition-relevant sections from wiki HTML.
@@ -169,30 +252,22 @@ def extract_acquisition_sections(html: str, max_length: int = _DEFAULT_HTML_LIMI
     For other pages, "Used in" is excluded since it only lists recipes
     where this item appears as an ingredient.
 
+    Comments, scripts, styles, citation markers, responsive image
+    attributes and whitespace runs are stripped first; they carry no
+    acquisition data.
+
     If the result is still too large, truncates to max_length characters.
     """
-    has_variants = bool(re.search(r'<span[^>]*id="Variants"[^>]*>', html, re.IGNORECASE))
-
-    excluded_sections = [
-        r'<span[^>]*id="Dropped_by"[^>]*>.*?(?=<h[1-3][ >]|$)',
-        r'<span[^>]*id="Currency_for"[^>]*>.*?(?=<h[12][ >]|$)',
-        r'<span[^>]*id="Recipe_sheet"[^>]*>.*?(?=<h[1-3][ >]|$)',
-        r'<span[^>]*id="Salvage_results"[^>]*>.*?(?=<h[1-3][ >]|$)',
-        r'<span[^>]*id="Map_Bonus_Reward"[^>]*>.*?(?=<h[1-3][ >]|$)',
-        r'<span[^>]*id="Rewarded_by"[^>]*>.*?(?=<h[1-3][ >]|$)',
-        r'<span[^>]*id="Trivia"[^>]*>.*?(?=<h[12][ >]|$)',
-        r'<span[^>]*id="Gallery"[^>]*>.*?(?=<h[12][ >]|$)',
-        r'<span[^>]*id="Notes"[^>]*>.*?(?=<h[12][ >]|$)',
-        r'<span[^>]*id="External_links"[^>]*>.*?(?=<h[12][ >]|$)',
-        r'<span[^>]*id="Guild_upgrades"[^>]*>.*?(?=<h[12][ >]|$)',
-    ]
+    html = compact_html(html)
+    has_variants = bool(_VARIANTS_RE.search(html))
 
+    excluded_sections = _EXCLUDED_SECTION_PATTERNS
     if not has_variants:
-        excluded_sections.append(r'<span[^>]*id="Used_in"[^>]*>.*?(?=<h[12][ >]|$)')
+        excluded_sections = [*excluded_sections, _USED_IN_SECTION_RE]
 
     filtered_html = html
     for pattern in excluded_sections:
-        filtered_html = re.sub(pattern, "", filtered_html, flags=re.DOTALL | re.IGNORECASE)
+        filtered_html = pattern.sub("", filtered_html)
 
     if len(filtered_html) > max_length:
         log.warning(
@@ -203,3 +278,67 @@ def extract_acquisition_sections(html: str, max_length: int = _DEFAULT_HTML_LIMI
         filtered_html = filtered_html[:max_length]
 
     return filtered_html
+
+
+def has_acquisition_content(html: str) -> bool:
+    """
+    Return False only when the page definitely has no acquisition content.
+
+    Pages with a known acquisition marker, or with any section heading not
+    known to be unrelated to acquisition, count as having content, so an
+    unrecognized heading still reaches the LLM.
+    """
+    if _ACQUISITION_MARKER_RE.search(html):
+        return True
+    return any(
+        section_id not in _NON_ACQUISITION_SECTION_IDS
+        for section_id in _HEADING_ID_RE.findall(html)
+    )
+
+
+def filter_variant_rows(html: str, rarity: str) -> str:
+    """
+    Drop vendor rows and containers for other rarities on Variants pages.
+
+    A vendor row's rarity comes from its rarity-{name} marker. Tables without
+    a Rarity column only sell the Ascended variant. Header rows and rows
+    without a readable rarity are kept. "Contained in" list entries are
+    dropped only when they carry a rarity marker for another rarity. Pages
+    without a Variants section are returned unchanged.
+    """
+    if not _VARIANTS_RE.search(html):
+        return html
+
+    target = rarity.lower()
+
+    def _filter_table(table_match: re.Match[str]) -> str:
+        table = table_match.group(0)
+        has_rarity_column = bool(_RARITY_CLASS_RE.search(table))
+
+        def _filter_row(row_match: re.Match[str]) -> str:
+            row = row_match.group(0)
+            if not _TABLE_CELL_RE.search(row):
+                return row
+            marker = _RARITY_CLASS_RE.search(row)
+            if marker:
+                row_rarity = marker.group(1).lower()
+            elif not has_rarity_column:
+                row_rarity = _DEFAULT_VENDOR_ROW_RARITY
+            else:
+                return row
+            return row if row_rarity == target else ""
+
+        return _TABLE_ROW_RE.sub(_filter_row, table)
+
+    def _filter_list_item(item_match: re.Match[str]) -> str:
+        item = item_match.group(0)
+        marker = _RARITY_CLASS_RE.search(item)
+        if marker and marker.group(1).lower() != target:
+            return ""
+        return item
+
+    def _filter_contained_in(section_match: re.Match[str]) -> str:
+        return _LIST_ITEM_RE.sub(_filter_list_item, section_match.group(0))
+
+    html = _VENDOR_TABLE_RE.sub(_filter_table, html)
+    return _CONTAINED_IN_SECTION_RE.sub(_filter_contained_in, html)
@@ -0,0 +1,35 @@
+"""
+YAML loading and dumping backed by libyaml when it is available.
+
+PyYAML only uses its C parser and emitter when they are requested
+explicitly. They produce the same values and output as the pure-Python
+safe classes and are several times faster on the item data and index
+files. Falls back to the pure-Python classes when PyYAML was built
+without libyaml.
+
+The C emitter wraps long double-quoted strings at different points than
+the pure-Python one, so hand-reviewed data files (items, vendors) are
+still written with yaml.dump to keep their diffs stable. Use dump() for
+generated index files.
+"""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+__all__ = ["SafeDumper", "SafeLoader", "dump", "load"]
+
+
+def load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: IO[str] | None = None, **kwargs: Any) -> Any:
+    kwargs.setdefault("Dumper", SafeDumper)
+    return yaml.dump(data, stream, **kwargs)
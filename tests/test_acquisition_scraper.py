@@ -0,0 +1,172 @@
+"""Tests for acquisition_scraper module — rule-based entries from wiki list templates."""
+
+from gw2_data.acquisition_scraper import extract_entries
+
+ACQUISITION = '<h2><span class="mw-headline" id="Acquisition">Acquisition</span></h2>'
+
+
+def _section(anchor: str, *rows: str) -> str:
+    title = anchor.replace("_", " ")
+    items = "".join(f'<li class="smw-row"><span>{row}</span></li>' for row in rows)
+    return (
+        f'<h3><span class="mw-headline" id="{anchor}">{title}</span></h3>'
+        f'<ul class="smw-format ul-format">{items}</ul>'
+    )
+
+
+def _link(name: str) -> str:
+    page = name.replace(" ", "_")
+    return f'<a href="/wiki/{page}"><img alt="{name}.png"></a> <a href="/wiki/{page}">{name}</a>'
+
+
+class TestGatheredFrom:
+    def test_parses_quantities_and_skips_chance(self):
+        html = ACQUISITION + _section(
+            "Gathered_from",
+            f"{_link('Mistborn Coffer')} (3)",
+            f"{_link('Buried Locked Chest')} (1-5) <small>(chance)</small>",
+            f"{_link('Rich Iron Vein')} (1–3)",
+        )
+
+        assert extract_entries(html) == [
+            {
+                "name": "Mistborn Coffer",
+                "wikiSection": "gathered_from",
+                "confidence": 1.0,
+                "quantity": 3,
+                "guaranteed": True,
+                "choice": False,
+            },
+            {
+                "name": "Rich Iron Vein",
+                "wikiSection": "gathered_from",
+                "confidence": 1.0,
+                "quantity": 1,
+                "quantityMin": 1,
+                "quantityMax": 3,
+                "guaranteed": True,
+                "choice": False,
+            },
+        ]
+
+
+class TestContainedIn:
+    def test_inline_choice(self):
+        html = ACQUISITION + _section(
+            "Contained_in",
+            f"{_link('Legendary Gift Starter Kit')} <small>(<b>choice</b>)</small>",
+            f"{_link('Random Box')} <small>(chance)</small>",
+        )
+
+        assert extract_entries(html) == [
+            {
+                "name": "Legendary Gift Starter Kit",
+                "wikiSection": "contained_in",
+                "confidence": 1.0,
+                "quantity": 1,
+                "wikiSubsection": "inline",
+                "guaranteed": False,
+                "choice": True,
+            }
+        ]
+
+    def test_h4_subsections(self):
+        html = (
+            '<h3><span class="mw-headline" id="Contained_in">Contained in</span></h3>'
+            '<h4><span class="mw-headline" id="Guaranteed">Guaranteed</span></h4>'
+            f'<ul class="smw-format ul-format"><li>{_link("Bag of Obsidian")} (3)</li></ul>'
+            '<h4><span class="mw-headline" id="Chance">Chance</span></h4>'
+            f'<ul class="smw-format ul-format"><li>{_link("Buried Treasure")} (1, 3)</li></ul>'
+        )
+
+        assert extract_entries(html) == [
+            {
+                "name": "Bag of Obsidian",
+                "wikiSection": "contained_in",
+                "confidence": 1.0,
+                "quantity": 3,
+                "wikiSubsection": "guaranteed",
+            }
+        ]
+
+    def test_name_with_parentheses_keeps_quantity(self):
+        html = _section("Contained_in", f"{_link('Chest (container)')} (2)")
+
+        entries = extract_entries(html)
+
+        assert entries is not None
+        assert entries[0]["name"] == "Chest (container)"
+        assert entries[0]["quantity"] == 2
+
+    def test_skips_historical_entries(self):
+        html = _section(
+            "Contained_in",
+            f"{_link('Old Box')} <small>(guaranteed)</small> <small>(historical)</small>",
+            f"{_link('New Box')} <small>(guaranteed)</small>",
+        )
+
+        entries = extract_entries(html)
+
+        assert entries is not None
+        assert [e["name"] for e in entries] == ["New Box"]
+
+
+class TestNonAcquisitionSections:
+    def test_known_sections_are_ignored(self):
+        html = (
+            _section("Contained_in", _link("Mistborn Coffer"))
+            + '<h2><span class="mw-headline" id="Notes">Notes</span></h2>'
+            + "<p>Can be salvaged.</p>"
+        )
+        entries = extract_entries(html)
+        assert entries is not None
+        assert [e["name"] for e in entries] == ["Mistborn Coffer"]
+
+
+class TestFallsBackToLlm:
+    def test_vendor_table(self):
+        html = (
+            ACQUISITION
+            + _section("Gathered_from", _link("Copper Ore"))
+            + '<table class="npc sortable table"><tr><td>Vendor</td></tr></table>'
+        )
+        assert extract_entries(html) is None
+
+    def test_other_acquisition_section(self):
+        html = _section("Gathered_from", _link("Copper Ore")) + _section(
+            "Salvaged_from", _link("Old Ore")
+        )
+        assert extract_entries(html) is None
+
+    def test_prose_in_acquisition(self):
+        html = ACQUISITION + "<p>Awarded for events.</p>" + _section("Gathered_from", _link("Ore"))
+        assert extract_entries(html) is None
+
+    def test_unknown_status_tag(self):
+        html = _section("Contained_in", f"{_link('Old Box')} <small>(rare)</small>")
+        assert extract_entries(html) is None
+
+    def test_generic_container(self):
+        html = _section("Contained_in", _link("Mistborn Coffer"), _link("Unidentified Gear"))
+        assert extract_entries(html) is None
+
+    def test_rarity_equipment_container(self):
+        html = _section("Contained_in", _link("Chest of Exotic Equipment"))
+        assert extract_entries(html) is None
+
+    def test_unrecognized_section(self):
+        html = (
+            _section("Contained_in", _link("Mistborn Coffer"))
+            + '<h2><span class="mw-headline" id="Achievement_reward">Achievement reward</span></h2>'
+            + "<p>Rewarded for completing the collection.</p>"
+        )
+        assert extract_entries(html) is None
+
+    def test_variants_page(self):
+        html = '<h2><span class="mw-headline" id="Variants">Variants</span></h2>' + _section(
+            "Contained_in", _link("Box")
+        )
+        assert extract_entries(html) is None
+
+    def test_no_list_sections(self):
+        assert extract_entries(ACQUISITION) is None
@@ -24,7 +24,7 @@ def test_get_item_success(mocker, cache_client: CacheClient):
         "rarity": "Exotic",
         "level": 80,
     }
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = mock_response
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -42,7 +42,7 @@ def test_get_item_caches_result(mocker, cache_client: CacheClient):
         "rarity": "Exotic",
         "level": 80,
     }
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = mock_response
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -62,7 +62,7 @@ def test_get_item_invalid_id(cache_client: CacheClient):
 
 
 def test_get_item_http_error(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_response = Response(404, request=Request("GET", "http://test.com"))
     mock_get.return_value.raise_for_status.side_effect = HTTPStatusError(
         "Not found", request=mock_response.request, response=mock_response
@@ -73,7 +73,7 @@ def test_get_item_http_error(mocker, cache_client: CacheClient):
 
 
 def test_get_item_network_error(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.side_effect = RequestError("Connection failed")
 
     with pytest.raises(APIError, match="Network error fetching item 123"):
@@ -90,7 +90,7 @@ def test_get_recipe_success(mocker, cache_client: CacheClient):
         "disciplines": ["Weaponsmith"],
         "ingredients": [{"item_id": 789, "count": 5}],
     }
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = mock_response
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -106,7 +106,7 @@ def test_get_recipe_invalid_id(cache_client: CacheClient):
 
 def test_search_recipes_by_output_success(mocker, cache_client: CacheClient):
     mock_response = [1, 2, 3, 4, 5]
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = mock_response
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -122,7 +122,7 @@ def test_search_recipes_by_output_invalid_id(cache_client: CacheClient):
 
 def test_search_recipes_by_output_caches_result(mocker, cache_client: CacheClient):
     mock_response = [1, 2, 3]
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = mock_response
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -190,6 +190,29 @@ def test_load_item_name_index_override_replaces_ambiguous(monkeypatch, tmp_path:
     assert result["Duplicate Name"] == [222]
 
 
+def test_load_item_name_index_uses_cached_snapshot(
+    mocker, monkeypatch, tmp_path: Path, cache_client: CacheClient
+):
+    index_dir = tmp_path / "data" / "index"
+    index_dir.mkdir(parents=True)
+    index_path = index_dir / "item_names.yaml"
+    index_path.write_text(yaml.dump({"Sword": [123]}))
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api, "_CONFIG_DIR", config_dir)
+    assert api.load_item_name_index(cache_client) == {"Sword": [123]}
+
+    load = mocker.patch.object(api.yaml_io, "load", wraps=api.yaml_io.load)
+    assert api.load_item_name_index(cache_client) == {"Sword": [123]}
+    load.assert_not_called()
+
+    index_path.write_text(yaml.dump({"Sword": [123, 456]}))
+    assert api.load_item_name_index(cache_client) == {"Sword": [123, 456]}
+
+
 def test_resolve_item_name_to_id_with_override():
     index = {"Agaleus": [105438, 105738, 106400], "Agaleus (heavy)": [105738]}
 
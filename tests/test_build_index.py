@@ -1,5 +1,7 @@
 """Tests for bulk API functions and build_index script."""
 
+import sys
+import time
 from collections import defaultdict
 from pathlib import Path
 
@@ -10,7 +12,7 @@ from httpx import HTTPStatusError, Request, RequestError, Response
 from gw2_data import api
 from gw2_data.cache import CacheClient
 from gw2_data.exceptions import APIError
-from gw2_data.types import BulkResult
+from gw2_data.types import BulkResult, NameIndexes
 
 
 @pytest.fixture
@@ -27,7 +29,7 @@ ITEM_C = {"id": 3, "name": "Sword", "type": "Weapon", "rarity": "Fine", "level":
 
 
 def test_get_all_item_ids_success(mocker):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = [1, 2, 3]
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -38,7 +40,7 @@ def test_get_all_item_ids_success(mocker):
 
 
 def test_get_all_item_ids_http_error(mocker):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_response = Response(500, request=Request("GET", "http://test.com"))
     mock_get.return_value.raise_for_status.side_effect = HTTPStatusError(
         "Server error", request=mock_response.request, response=mock_response
@@ -49,7 +51,7 @@ def test_get_all_item_ids_http_error(mocker):
 
 
 def test_get_all_item_ids_network_error(mocker):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.side_effect = RequestError("Connection failed")
 
     with pytest.raises(APIError, match="Network error fetching item IDs"):
@@ -60,7 +62,7 @@ def test_get_all_item_ids_network_error(mocker):
 
 
 def test_get_items_bulk_success(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = [ITEM_A, ITEM_B]
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -76,7 +78,7 @@ def test_get_items_bulk_success(mocker, cache_client: CacheClient):
 def test_get_items_bulk_all_cached(mocker, cache_client: CacheClient):
     cache_client.set_api_item(1, ITEM_A)
     cache_client.set_api_item(2, ITEM_B)
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
 
     result = api.get_items_bulk([1, 2], cache_client)
 
@@ -87,7 +89,7 @@ def test_get_items_bulk_all_cached(mocker, cache_client: CacheClient):
 
 def test_get_items_bulk_partial_cache_miss(mocker, cache_client: CacheClient):
     cache_client.set_api_item(1, ITEM_A)
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = [ITEM_A, ITEM_B]
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -101,7 +103,7 @@ def test_get_items_bulk_partial_cache_miss(mocker, cache_client: CacheClient):
 def test_get_items_bulk_force_bypasses_cache(mocker, cache_client: CacheClient):
     cache_client.set_api_item(1, ITEM_A)
     cache_client.set_api_item(2, ITEM_B)
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_get.return_value.json.return_value = [ITEM_A, ITEM_B]
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -112,6 +114,19 @@ def test_get_items_bulk_force_bypasses_cache(mocker, cache_client: CacheClient):
     mock_get.assert_called_once()
 
 
+def test_get_items_bulk_calls_before_request_only_for_api_fetch(mocker, cache_client: CacheClient):
+    mock_get = mocker.patch("gw2_data.api._client.get")
+    mock_get.return_value.json.return_value = [ITEM_A]
+    mock_get.return_value.raise_for_status = lambda: None
+    before_request = mocker.Mock()
+
+    api.get_items_bulk([1], cache_client, before_request=before_request)
+    api.get_items_bulk([1], cache_client, before_request=before_request)
+
+    before_request.assert_called_once()
+    mock_get.assert_called_once()
+
+
 def test_get_items_bulk_empty_list(cache_client: CacheClient):
     result = api.get_items_bulk([], cache_client)
     assert result.items == []
@@ -124,7 +139,7 @@ def test_get_items_bulk_over_200_raises(cache_client: CacheClient):
 
 
 def test_get_items_bulk_http_error(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.api._client.get")
     mock_response = Response(503, request=Request("GET", "http://test.com"))
     mock_get.return_value.raise_for_status.side_effect = HTTPStatusError(
         "Unavailable", request=mock_response.request, response=mock_response
@@ -197,7 +212,7 @@ def test_build_index_retries_failed_batches(mocker, tmp_path: Path):
 
     call_count = 0
 
-    def mock_bulk(ids, c, *, force=False):
+    def mock_bulk(ids, c, *, force=False, before_request=None):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
@@ -219,6 +234,58 @@ def test_build_index_retries_failed_batches(mocker, tmp_path: Path):
     assert "Shield" in index
 
 
+def test_build_index_merges_concurrent_batches(mocker, tmp_path: Path):
+    from scripts.build_index import build_item_index
+
+    cache = CacheClient(tmp_path / "cache")
+    items = {item["id"]: item for item in (ITEM_A, ITEM_B, ITEM_C)}
+    mocker.patch.object(api, "get_all_item_ids", return_value=[3, 2, 1])
+    mocker.patch.object(
+        api,
+        "get_items_bulk",
+        side_effect=lambda ids, c, **kwargs: BulkResult(
+            items=[items[i] for i in ids], from_cache=False
+        ),
+    )
+
+    index_path = tmp_path / "index" / "item_names.yaml"
+    mocker.patch("scripts.build_index.INDEX_DIR", tmp_path / "index")
+    mocker.patch("scripts.build_index.ITEM_NAMES_PATH", index_path)
+    mocker.patch("scripts.build_index.BATCH_SIZE", 1)
+    mocker.patch("scripts.build_index.BATCH_DELAY", 0)
+
+    build_item_index(cache)
+
+    index = yaml.safe_load(index_path.read_text())
+    assert index == {"Shield": [2], "Sword": [1, 3]}
+
+
+def test_build_index_spaces_api_requests_across_workers(mocker, tmp_path: Path):
+    from scripts.build_index import build_item_index
+
+    cache = CacheClient(tmp_path / "cache")
+    items = {item["id"]: item for item in (ITEM_A, ITEM_B, ITEM_C)}
+    mocker.patch.object(api, "get_all_item_ids", return_value=[1, 2, 3])
+    request_times: list[float] = []
+
+    def mock_bulk(ids, c, *, force=False, before_request=None):
+        before_request()
+        request_times.append(time.monotonic())
+        return BulkResult(items=[items[i] for i in ids], from_cache=False)
+
+    mocker.patch.object(api, "get_items_bulk", side_effect=mock_bulk)
+    mocker.patch("scripts.build_index.INDEX_DIR", tmp_path / "index")
+    mocker.patch("scripts.build_index.ITEM_NAMES_PATH", tmp_path / "index" / "item_names.yaml")
+    mocker.patch("scripts.build_index.BATCH_SIZE", 1)
+    mocker.patch("scripts.build_index.BATCH_DELAY", 0.05)
+
+    start = time.monotonic()
+    build_item_index(cache)
+
+    assert len(request_times) == 3
+    assert max(request_times) - start >= 0.1
+
+
 def test_build_index_uses_flow_style_lists(mocker, tmp_path: Path):
     from scripts.build_index import build_item_index
 
@@ -403,6 +470,168 @@ def test_item_name_resolution_single_match(mocker, monkeypatch, tmp_path: Path,
     assert "Gift of Metal" in captured.out
 
 
+def test_populate_item_skips_unchanged_file(mocker, monkeypatch, tmp_path: Path, capsys):
+    index_dir = tmp_path / "data" / "index"
+    index_dir.mkdir(parents=True)
+    (index_dir / "item_names.yaml").write_text(yaml.dump({"Gift of Metal": [19676]}))
+    (index_dir / "currency_names.yaml").write_text(yaml.dump({"Coin": 1}))
+
+    monkeypatch.chdir(tmp_path)
+
+    mock_item = {
+        "id": 19676,
+        "name": "Gift of Metal",
+        "type": "Trophy",
+        "rarity": "Legendary",
+        "level": 0,
+    }
+    mocker.patch.object(api, "get_item", return_value=mock_item)
+    mocker.patch("scripts.populate.wiki.get_page_html", return_value="<html>test</html>")
+    mocker.patch(
+        "scripts.populate.llm.extract_entries",
+        return_value=mocker.Mock(
+            entries=[],
+            overall_confidence=1.0,
+            entry_confidences=[],
+            notes="",
+        ),
+    )
+    mocker.patch.object(api, "load_gathering_node_index", return_value=set())
+
+    from scripts import populate
+
+    cache = CacheClient(tmp_path / "cache")
+    output_path = tmp_path / "data" / "items" / "19676.yaml"
+
+    populate.populate_item(19676, cache)
+    existing = yaml.safe_load(output_path.read_text())
+    existing["lastUpdated"] = "2020-01-01"
+    output_path.write_text(yaml.dump(existing, sort_keys=False, allow_unicode=True))
+    written = output_path.stat().st_mtime_ns
+    capsys.readouterr()
+
+    populate.populate_item(19676, cache, overwrite=True)
+
+    assert "No changes from existing file." in capsys.readouterr().out
+    assert output_path.stat().st_mtime_ns == written
+    assert yaml.safe_load(output_path.read_text())["lastUpdated"] == "2020-01-01"
+
+
+@pytest.mark.parametrize("existing", ["", "id: 19676\nname: [Gift of", "- not a mapping\n"])
+def test_populate_item_overwrites_unreadable_file(mocker, monkeypatch, tmp_path: Path, existing):
+    monkeypatch.chdir(tmp_path)
+
+    mock_item = {
+        "id": 19676,
+        "name": "Gift of Metal",
+        "type": "Trophy",
+        "rarity": "Legendary",
+        "level": 0,
+    }
+    mocker.patch.object(api, "get_item", return_value=mock_item)
+    mocker.patch("scripts.populate.wiki.get_page_html", return_value="<html>test</html>")
+    mocker.patch(
+        "scripts.populate.llm.extract_entries",
+        return_value=mocker.Mock(
+            entries=[],
+            overall_confidence=1.0,
+            entry_confidences=[],
+            notes="",
+        ),
+    )
+    mocker.patch.object(api, "load_gathering_node_index", return_value=set())
+    mocker.patch.object(api, "load_name_indexes")
+
+    from scripts import populate
+
+    output_path = tmp_path / "data" / "items" / "19676.yaml"
+    output_path.parent.mkdir(parents=True)
+    output_path.write_text(existing)
+
+    populate.populate_item(19676, CacheClient(tmp_path / "cache"), overwrite=True)
+
+    written = yaml.safe_load(output_path.read_text())
+    assert written["id"] == 19676
+    assert written["name"] == "Gift of Metal"
+
+
+def test_populate_item_uses_given_indexes(mocker, monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+
+    mock_item = {
+        "id": 19676,
+        "name": "Gift of Metal",
+        "type": "Trophy",
+        "rarity": "Legendary",
+        "level": 0,
+    }
+    mocker.patch.object(api, "get_item", return_value=mock_item)
+    mocker.patch("scripts.populate.wiki.get_page_html", return_value="<html>test</html>")
+    mocker.patch(
+        "scripts.populate.llm.extract_entries",
+        return_value=mocker.Mock(
+            entries=[],
+            overall_confidence=1.0,
+            entry_confidences=[],
+            notes="",
+        ),
+    )
+    load_indexes = mocker.patch.object(api, "load_name_indexes")
+
+    from scripts import populate
+
+    indexes = NameIndexes(items={"Gift of Metal": [19676]}, currencies={}, gathering_nodes=set())
+    populate.populate_item(19676, CacheClient(tmp_path / "cache"), dry_run=True, indexes=indexes)
+
+    load_indexes.assert_not_called()
+
+
+def test_prefetch_extractions_batches_non_basic_items(mocker, tmp_path: Path):
+    items = {
+        1: {"id": 1, "name": "Sword", "type": "Weapon", "rarity": "Exotic", "level": 80},
+        2: {
+            "id": 2,
+            "name": "Lump of Tin",
+            "type": "CraftingMaterial",
+            "rarity": "Basic",
+            "level": 0,
+            "description": "Ingredient",
+        },
+        3: {"id": 3, "name": "Shield", "type": "Weapon", "rarity": "Rare", "level": 80},
+    }
+    mocker.patch.object(api, "get_item", side_effect=lambda item_id, cache: items[item_id])
+    mocker.patch.object(api, "load_wiki_page_overrides", return_value={})
+    mocker.patch("scripts.populate.wiki.get_page_html", return_value="<html>test</html>")
+    extract_batch = mocker.patch("scripts.populate.llm.extract_entries_batch")
+
+    from scripts import populate
+
+    populate.prefetch_extractions([1, 2, 3], CacheClient(tmp_path / "cache"))
+
+    requests = extract_batch.call_args.args[0]
+    assert [r.item_id for r in requests] == [1, 3]
+
+
+def test_main_prefetches_extractions_for_multiple_items(mocker, monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "items").mkdir(parents=True)
+    (tmp_path / "data" / "items" / "2.yaml").write_text("id: 2\n")
+    monkeypatch.setattr(sys, "argv", ["populate", "--item-id", "1,2,3"])
+    settings = mocker.patch("scripts.populate.get_settings").return_value
+    settings.cache_dir = tmp_path / "cache"
+    settings.log_level = "INFO"
+    mocker.patch.object(api, "load_name_indexes")
+    prefetch = mocker.patch("scripts.populate.prefetch_extractions")
+    populate_item = mocker.patch("scripts.populate.populate_item")
+
+    from scripts import populate
+
+    populate.main()
+
+    assert prefetch.call_args.args[0] == [1, 3]
+    assert populate_item.call_count == 3
+
+
 def test_item_name_resolution_no_match(monkeypatch, tmp_path: Path):
     index_data = {"Gift of Metal": [19676]}
     index_dir = tmp_path / "data" / "index"
@@ -434,6 +663,39 @@ def test_item_name_resolution_multiple_matches(monkeypatch, tmp_path: Path):
     assert len(matches) > 1
 
 
+def test_resolve_item_names_skips_missing_and_ambiguous():
+    from scripts.populate import resolve_item_names
+
+    index = {"Gift of Metal": [19676], "Sword": [1, 3]}
+    names = ["Gift of Metal", "", "Sword", "Nonexistent Item", "  Gift  of Metal "]
+
+    assert resolve_item_names(names, index) == [19676, 19676]
+
+
+def test_main_loads_name_indexes_once_for_names_file(mocker, monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    names_file = tmp_path / "names.txt"
+    names_file.write_text("Sword\nShield\n")
+    monkeypatch.setattr(sys, "argv", ["populate", "--item-names-file", str(names_file)])
+    settings = mocker.patch("scripts.populate.get_settings").return_value
+    settings.cache_dir = tmp_path / "cache"
+    settings.log_level = "INFO"
+    indexes = NameIndexes(items={"Sword": [1], "Shield": [2]}, currencies={}, gathering_nodes=set())
+    load_indexes = mocker.patch.object(api, "load_name_indexes", return_value=indexes)
+    load_item_index = mocker.patch.object(api, "load_item_name_index")
+    mocker.patch("scripts.populate.prefetch_extractions")
+    populate_item = mocker.patch("scripts.populate.populate_item")
+
+    from scripts import populate
+
+    populate.main()
+
+    load_indexes.assert_called_once()
+    load_item_index.assert_not_called()
+    assert [c.args[0] for c in populate_item.call_args_list] == [1, 2]
+    assert all(c.kwargs["indexes"] is indexes for c in populate_item.call_args_list)
+
+
 def test_clean_name_normalizes_whitespace():
     assert api.clean_name("  Item Name  ") == "Item Name"
     assert api.clean_name("Item\nName") == "Item Name"
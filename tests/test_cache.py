@@ -200,3 +200,26 @@ def test_llm_extraction_cache_hit_requires_exact_rarity_match(cache_client: Cach
         83162, "Ardent Glorious Armguards", "abc123", "haiku", "Ascended"
     )
     assert miss_result is None
+
+
+def test_name_index_cache_roundtrip(cache_client: CacheClient):
+    index = {"Sword": [1, 3]}
+
+    cache_client.set_name_index("item_names", "abc", index)
+
+    assert cache_client.get_name_index("item_names", "abc") == index
+
+
+def test_name_index_cache_hash_mismatch(cache_client: CacheClient):
+    cache_client.set_name_index("item_names", "abc", {"Sword": [1]})
+
+    assert cache_client.get_name_index("item_names", "def") is None
+
+
+def test_item_children_cache_roundtrip(cache_client: CacheClient):
+    index = {19676: ((1, 2), {19684}, [])}
+
+    assert cache_client.get_item_children() is None
+    cache_client.set_item_children(index)
+
+    assert cache_client.get_item_children() == index
@@ -0,0 +1,38 @@
+"""Tests for gathering_scraper module — node names from the Gathering wiki page."""
+
+from gw2_data.gathering_scraper import extract_gathering_nodes
+
+
+def _node_table(header: str, *rows: str) -> str:
+    body = "".join(f"<tr><td>{cell}</td><td>Details</td></tr>" for cell in rows)
+    return f'<table class="table"><tr><th>{header}</th><th>Material</th></tr>{body}</table>'
+
+
+class TestExtractGatheringNodes:
+    def test_reads_linked_names_from_node_column(self):
+        html = _node_table(
+            "Node",
+            '<a href="/wiki/Copper_Ore"><img alt="Copper Ore.png"></a> '
+            '<a href="/wiki/Copper_Ore">Copper Ore</a>',
+            '<a href="/wiki/Rich_Iron_Vein">Rich Iron Vein</a>',
+        )
+        assert extract_gathering_nodes(html) == ["Copper Ore", "Rich Iron Vein"]
+
+    def test_accepts_node_name_header_and_plain_text(self):
+        html = _node_table("Node name", "Herb Patch")
+        assert extract_gathering_nodes(html) == ["Herb Patch"]
+
+    def test_collects_across_tables_without_duplicates(self):
+        html = (
+            _node_table("Node", '<a href="/wiki/Aspen_Sapling">Aspen Sapling</a>')
+            + "<h2>Mining</h2>"
+            + _node_table("Node", '<a href="/wiki/Aspen_Sapling">Aspen Sapling</a>', "Clam")
+        )
+        assert extract_gathering_nodes(html) == ["Aspen Sapling", "Clam"]
+
+    def test_ignores_tables_without_node_column(self):
+        html = _node_table("Tool", '<a href="/wiki/Copper_Harvesting_Sickle">Sickle</a>')
+        assert extract_gathering_nodes(html) == []
+
+    def test_empty_page(self):
+        assert extract_gathering_nodes("") == []
@@ -10,6 +10,8 @@ from gw2_data.cache import CacheClient
 from gw2_data.exceptions import ExtractionError
 from gw2_data.llm import ExtractionResult, _parse_llm_response
 
+WIKI_HTML = '<html><h2><span id="Acquisition">Acquisition</span></h2>test</html>'
+
 
 @pytest.fixture
 def cache_client(tmp_path: Path) -> CacheClient:
@@ -75,7 +77,7 @@ class TestParseLlmResponse:
     def test_parses_json_with_bare_code_fences(self):
         text = '```\n{"entries": []}\n```'
         result = _parse_llm_response(text)
-        assert result == {"entries": []}
+        assert result == {"entries": [], "overallConfidence": 0.0}
 
     def test_raises_on_invalid_json(self):
         with pytest.raises(ExtractionError, match="Failed to parse LLM response"):
@@ -84,16 +86,40 @@ class TestParseLlmResponse:
     def test_handles_whitespace(self):
         text = '  \n  {"entries": []}  \n  '
         result = _parse_llm_response(text)
-        assert result == {"entries": []}
+        assert result == {"entries": [], "overallConfidence": 0.0}
+
+    def test_returns_validated_values(self):
+        text = '{"entries": [{"name": "X", "wikiSection": "vendor", "confidence": "0.5"}]}'
+        result = _parse_llm_response(text)
+        assert result["entries"] == [
+            {"name": "X", "wikiSection": "vendor", "confidence": 0.5, "quantity": 1}
+        ]
+
+    def test_defaults_missing_entry_confidence(self):
+        text = '{"entries": [{"name": "X", "wikiSection": "vendor"}]}'
+        result = _parse_llm_response(text)
+        assert result["entries"][0]["confidence"] == 0.0
+
+    def test_raises_on_missing_required_field(self):
+        text = '{"entries": [{"name": "Vendor", "confidence": 1.0}]}'
+        with pytest.raises(ExtractionError, match="does not match extraction schema"):
+            _parse_llm_response(text)
+
+    def test_raises_on_unknown_wiki_section(self):
+        text = '{"entries": [{"name": "X", "wikiSection": "dropped_by", "confidence": 1.0}]}'
+        with pytest.raises(ExtractionError, match="does not match extraction schema"):
+            _parse_llm_response(text)
+
+    def test_raises_on_non_object_response(self):
+        with pytest.raises(ExtractionError, match="does not match extraction schema"):
+            _parse_llm_response("[]")
 
 
 class TestExtractEntries:
     def test_returns_extraction_result(self, mocker, cache_client, api_data, llm_response_json):
         _mock_claude_cli(mocker, llm_response_json)
 
-        result = llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client
-        )
+        result = llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
         assert isinstance(result, ExtractionResult)
         assert len(result.entries) == 1
@@ -105,9 +131,7 @@ class TestExtractEntries:
     def test_entries_have_correct_fields(self, mocker, cache_client, api_data, llm_response_json):
         _mock_claude_cli(mocker, llm_response_json)
 
-        result = llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client
-        )
+        result = llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
         assert len(result.entries) == 1
         assert result.entries[0]["wikiSection"] == "recipe"
@@ -116,12 +140,8 @@ class TestExtractEntries:
     def test_caches_result(self, mocker, cache_client, api_data, llm_response_json):
         mock_run = _mock_claude_cli(mocker, llm_response_json)
 
-        result1 = llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client
-        )
-        result2 = llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client
-        )
+        result1 = llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
+        result2 = llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
         assert result1.entries == result2.entries
         assert result1.overall_confidence == result2.overall_confidence
@@ -133,8 +153,8 @@ class TestExtractEntries:
         mock_cache = MagicMock()
         mock_cache.get_llm_extraction.return_value = None
 
-        llm.extract_entries(123, "Test Item", "<html>Version 1</html>", api_data, cache=mock_cache)
-        llm.extract_entries(123, "Test Item", "<html>Version 2</html>", api_data, cache=mock_cache)
+        llm.extract_entries(123, "Test Item", WIKI_HTML + "v1", api_data, cache=mock_cache)
+        llm.extract_entries(123, "Test Item", WIKI_HTML + "v2", api_data, cache=mock_cache)
 
         assert mock_cache.set_llm_extraction.call_count == 2
         call1_hash = mock_cache.set_llm_extraction.call_args_list[0][0][2]
@@ -147,7 +167,7 @@ class TestExtractEntries:
         llm.extract_entries(
             123,
             "Test Item",
-            "<html>test</html>",
+            WIKI_HTML,
             api_data,
             cache=cache_client,
             model="sonnet",
@@ -163,10 +183,10 @@ class TestExtractEntries:
         mock_run = _mock_claude_cli(mocker, llm_response_json)
 
         llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client, model="haiku"
+            123, "Test Item", WIKI_HTML, api_data, cache=cache_client, model="haiku"
         )
         llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client, model="sonnet"
+            123, "Test Item", WIKI_HTML, api_data, cache=cache_client, model="sonnet"
         )
 
         assert mock_run.call_count == 2
@@ -175,10 +195,10 @@ class TestExtractEntries:
         mock_run = _mock_claude_cli(mocker, llm_response_json)
 
         llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client, model="haiku"
+            123, "Test Item", WIKI_HTML, api_data, cache=cache_client, model="haiku"
         )
         llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client, model="haiku"
+            123, "Test Item", WIKI_HTML, api_data, cache=cache_client, model="haiku"
         )
 
         assert mock_run.call_count == 1
@@ -192,9 +212,7 @@ class TestExtractEntries:
         )
         _mock_claude_cli(mocker, empty_response)
 
-        result = llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client
-        )
+        result = llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
         assert result.entries == []
         assert result.overall_confidence == 1.0
@@ -205,13 +223,13 @@ class TestExtractEntries:
         _mock_claude_cli(mocker, "not valid json")
 
         with pytest.raises(ExtractionError, match="Failed to parse LLM response"):
-            llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+            llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
     def test_raises_on_cli_failure(self, mocker, cache_client, api_data):
         _mock_claude_cli(mocker, "", returncode=1, stderr="auth error")
 
         with pytest.raises(ExtractionError, match="claude CLI failed"):
-            llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+            llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
     def test_raises_on_cli_not_found(self, mocker, cache_client, api_data):
         mocker.patch(
@@ -220,7 +238,7 @@ class TestExtractEntries:
         )
 
         with pytest.raises(ExtractionError, match="claude CLI not found"):
-            llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+            llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
     def test_raises_on_timeout(self, mocker, cache_client, api_data):
         mocker.patch(
@@ -229,19 +247,91 @@ class TestExtractEntries:
         )
 
         with pytest.raises(ExtractionError, match="timed out"):
-            llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+            llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
+
+    def test_page_without_acquisition_sections_skips_cli(self, mocker, cache_client, api_data):
+        mock_run = _mock_claude_cli(mocker, "")
+
+        result = llm.extract_entries(
+            123, "Test Item", "<p>Lore only</p>", api_data, cache=cache_client
+        )
+
+        mock_run.assert_not_called()
+        assert result.entries == []
+        assert result.overall_confidence == 1.0
+
+    def test_unrecognized_section_reaches_cli(self, mocker, cache_client, api_data):
+        mock_run = _mock_claude_cli(mocker, '{"entries": [], "overallConfidence": 0.8}')
+        html = '<h2><span class="mw-headline" id="Obtained_from">Obtained from</span></h2>'
+
+        result = llm.extract_entries(123, "Test Item", html, api_data, cache=cache_client)
+
+        mock_run.assert_called_once()
+        assert result.overall_confidence == 0.8
+
+    def test_list_only_page_skips_cli(self, mocker, cache_client, api_data):
+        mock_run = _mock_claude_cli(mocker, "")
+        html = (
+            '<h3><span class="mw-headline" id="Gathered_from">Gathered from</span></h3>'
+            '<ul class="smw-format ul-format">'
+            '<li class="smw-row"><a href="/wiki/Rich_Iron_Vein">Rich Iron Vein</a> (1-3)</li>'
+            "</ul>"
+        )
+
+        result = llm.extract_entries(123, "Test Item", html, api_data, cache=cache_client)
+
+        mock_run.assert_not_called()
+        assert [e["name"] for e in result.entries] == ["Rich Iron Vein"]
+        assert result.entry_confidences == [1.0]
 
     def test_pipes_prompt_via_stdin(self, mocker, cache_client, api_data, llm_response_json):
         mock_run = _mock_claude_cli(mocker, llm_response_json)
 
-        llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+        llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
 
         call_kwargs = mock_run.call_args[1]
         assert "input" in call_kwargs
-        assert "<html>test</html>" in call_kwargs["input"]
+        assert WIKI_HTML in call_kwargs["input"]
         cmd = mock_run.call_args[0][0]
         assert cmd[-1] == "-"
 
+    def test_request_prefix_is_system_prompt_only(
+        self, mocker, cache_client, api_data, llm_response_json
+    ):
+        mock_run = _mock_claude_cli(mocker, llm_response_json)
+
+        llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--tools") + 1] == ""
+        assert "--strict-mcp-config" in cmd
+        assert cmd[cmd.index("--system-prompt") + 1] is llm.SYSTEM_PROMPT
+
+    def test_includes_examples_only_for_present_sections(
+        self, mocker, cache_client, api_data, llm_response_json
+    ):
+        mock_run = _mock_claude_cli(mocker, llm_response_json)
+        html = WIKI_HTML + '<div class="recipe-box"><div class="heading">Test Item</div></div>'
+
+        llm.extract_entries(123, "Test Item", html, api_data, cache=cache_client)
+
+        prompt = mock_run.call_args[1]["input"]
+        assert "### recipe\n" in prompt
+        assert "### vendor\n" not in prompt
+        assert prompt.index("## Examples") < prompt.index("## Wiki Page HTML")
+
+    def test_contained_in_examples_follow_page_pattern(
+        self, mocker, cache_client, api_data, llm_response_json
+    ):
+        mock_run = _mock_claude_cli(mocker, llm_response_json)
+        html = WIKI_HTML + '<h3><span id="Contained_in">Contained in</span></h3>'
+
+        llm.extract_entries(123, "Test Item", html, api_data, cache=cache_client)
+
+        prompt = mock_run.call_args[1]["input"]
+        assert "### contained_in_inline\n" in prompt
+        assert "### contained_in_h4\n" not in prompt
+
     def test_model_sets_html_limit(self, mocker, cache_client, api_data, llm_response_json):
         _mock_claude_cli(mocker, llm_response_json)
         mock_extract = mocker.patch(
@@ -251,21 +341,192 @@ class TestExtractEntries:
         mocker.patch("gw2_data.llm.wiki.get_html_limit_for_model", return_value=600_000)
 
         llm.extract_entries(
-            123, "Test Item", "<html>test</html>", api_data, cache=cache_client, model="sonnet"
+            123, "Test Item", WIKI_HTML, api_data, cache=cache_client, model="sonnet"
         )
 
-        mock_extract.assert_called_once_with("<html>test</html>", max_length=600_000)
+        mock_extract.assert_called_once_with(WIKI_HTML, max_length=600_000)
 
     def test_prompt_change_busts_cache(self, mocker, cache_client, api_data, llm_response_json):
         mock_run = _mock_claude_cli(mocker, llm_response_json)
 
-        llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+        llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
         assert mock_run.call_count == 1
 
-        original_hash = llm._PROMPT_HASH
-        mocker.patch.object(llm, "_PROMPT_HASH", "different_prompt_hash")
+        original_hash = llm.PROMPT_HASH
+        mocker.patch.object(llm, "PROMPT_HASH", "different_prompt_hash")
 
-        llm.extract_entries(123, "Test Item", "<html>test</html>", api_data, cache=cache_client)
+        llm.extract_entries(123, "Test Item", WIKI_HTML, api_data, cache=cache_client)
         assert mock_run.call_count == 2
 
-        mocker.patch.object(llm, "_PROMPT_HASH", original_hash)
+        mocker.patch.object(llm, "PROMPT_HASH", original_hash)
+
+
+def _batch_request(item_id: int, html: str, rarity: str = "Exotic") -> llm.ExtractionRequest:
+    return llm.ExtractionRequest(
+        item_id=item_id,
+        item_name=f"Item {item_id}",
+        wiki_html=f'<h2><span id="Acquisition">Acquisition</span></h2>{html}',
+        api_data={"id": item_id, "name": f"Item {item_id}", "type": "Weapon", "rarity": rarity},
+    )
+
+
+def _batch_response(*item_ids: int) -> str:
+    return "\n".join(
+        json.dumps(
+            {
+                "itemId": item_id,
+                "entries": [
+                    {"name": f"Vendor {item_id}", "wikiSection": "vendor", "confidence": 1.0}
+                ],
+                "overallConfidence": 0.9,
+            }
+        )
+        for item_id in item_ids
+    )
+
+
+class TestExtractEntriesBatch:
+    def test_single_cli_call_for_all_items(self, mocker, cache_client):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1, 2))
+
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")],
+            cache=cache_client,
+        )
+
+        assert mock_run.call_count == 1
+        prompt = mock_run.call_args[1]["input"]
+        assert "<p>one</p>" in prompt
+        assert "<p>two</p>" in prompt
+        assert results[1].entries[0]["name"] == "Vendor 1"
+        assert results[2].entry_confidences == [1.0]
+
+    def test_examples_emitted_once_per_batch(self, mocker, cache_client):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1, 2))
+        recipe = '<div class="recipe-box">{}</div>'
+
+        llm.extract_entries_batch(
+            [_batch_request(1, recipe.format("one")), _batch_request(2, recipe.format("two"))],
+            cache=cache_client,
+        )
+
+        prompt = mock_run.call_args[1]["input"]
+        assert prompt.count("### recipe\n") == 1
+        assert prompt.index("### recipe\n") < prompt.index("# Item 1 of 2")
+
+    def test_results_are_cached_per_item(self, mocker, cache_client, api_data):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1, 2))
+        requests = [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")]
+
+        llm.extract_entries_batch(requests, cache=cache_client)
+        llm.extract_entries_batch(requests, cache=cache_client)
+        single = llm.extract_entries(
+            1, "Item 1", requests[0].wiki_html, {**api_data, "id": 1}, cache=cache_client
+        )
+
+        assert mock_run.call_count == 1
+        assert single.entries[0]["name"] == "Vendor 1"
+
+    def test_only_uncached_items_are_sent(self, mocker, cache_client):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1))
+        llm.extract_entries_batch([_batch_request(1, "<p>one</p>")], cache=cache_client)
+
+        mock_run = _mock_claude_cli(mocker, _batch_response(2))
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")],
+            cache=cache_client,
+        )
+
+        prompt = mock_run.call_args[1]["input"]
+        assert "<p>one</p>" not in prompt
+        assert set(results) == {1, 2}
+
+    def test_omitted_items_missing_from_results(self, mocker, cache_client):
+        _mock_claude_cli(mocker, _batch_response(1))
+
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")],
+            cache=cache_client,
+        )
+
+        assert set(results) == {1}
+
+    def test_pages_without_acquisition_sections_skip_cli(self, mocker, cache_client):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1))
+        no_acquisition = _batch_request(2, "")
+        no_acquisition.wiki_html = "<p>Lore only</p>"
+
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), no_acquisition], cache=cache_client
+        )
+
+        assert "Lore only" not in mock_run.call_args[1]["input"]
+        assert results[2].entries == []
+
+    def test_splits_calls_at_item_limit(self, mocker, cache_client):
+        mock_run = _mock_claude_cli(mocker, _batch_response(1, 2, 3))
+
+        llm.extract_entries_batch(
+            [_batch_request(i, f"<p>{i}</p>") for i in (1, 2, 3)],
+            cache=cache_client,
+            max_items_per_call=2,
+        )
+
+        assert mock_run.call_count == 2
+
+    def test_malformed_line_only_drops_that_item(self, mocker, cache_client):
+        output = _batch_response(1) + '\n{"itemId": 2, "entries": [{"name": "X"}]}\nnot json'
+        _mock_claude_cli(mocker, output)
+
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")],
+            cache=cache_client,
+        )
+
+        assert set(results) == {1}
+
+    def test_accepts_fenced_ndjson(self, mocker, cache_client):
+        _mock_claude_cli(mocker, f"```json\n{_batch_response(1, 2)}\n```")
+
+        results = llm.extract_entries_batch(
+            [_batch_request(1, "<p>one</p>"), _batch_request(2, "<p>two</p>")],
+            cache=cache_client,
+        )
+
+        assert set(results) == {1, 2}
+
+
+class TestPackBatches:
+    def test_packs_small_prompts_together(self):
+        prompts = {1: "a" * 60, 2: "b" * 30, 3: "c" * 30, 4: "d" * 40}
+        batches = llm._pack_batches(prompts, budget=100, max_items=8)
+        assert batches == [[1, 4], [2, 3]]
+
+    def test_oversized_prompt_gets_own_batch(self):
+        prompts = {1: "a" * 500, 2: "b" * 10}
+        assert llm._pack_batches(prompts, budget=100, max_items=8) == [[1], [2]]
+
+    def test_respects_max_items(self):
+        prompts = {i: "x" for i in range(5)}
+        batches = llm._pack_batches(prompts, budget=100, max_items=2)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_empty(self):
+        assert llm._pack_batches({}, budget=100, max_items=8) == []
+
+    def test_shared_examples_counted_once(self, mocker):
+        mocker.patch.dict(llm._EXAMPLE_SIZES, {"recipe": 40})
+        prompts = {1: "a" * 30, 2: "b" * 30}
+        examples = {1: ["recipe"], 2: ["recipe"]}
+        assert llm._pack_batches(prompts, budget=100, max_items=8, item_examples=examples) == [
+            [1, 2]
+        ]
+
+    def test_distinct_examples_count_against_budget(self, mocker):
+        mocker.patch.dict(llm._EXAMPLE_SIZES, {"recipe": 40, "vendor": 40})
+        prompts = {1: "a" * 30, 2: "b" * 30}
+        examples = {1: ["recipe"], 2: ["vendor"]}
+        assert llm._pack_batches(prompts, budget=100, max_items=8, item_examples=examples) == [
+            [1],
+            [2],
+        ]
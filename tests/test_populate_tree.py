@@ -0,0 +1,164 @@
+"""Tests for the populate_tree traversal scheduler."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import yaml
+
+from gw2_data.cache import CacheClient
+from scripts import populate_tree
+
+TREE = {1: [2, 3], 2: [4], 3: [], 4: [], 5: [], 6: [], 7: []}
+
+
+def _write_item(item_id: int) -> None:
+    data = {
+        "id": item_id,
+        "acquisitions": [
+            {
+                "type": "crafting",
+                "requirements": [{"itemId": cid, "quantity": 1} for cid in TREE[item_id]],
+            }
+        ],
+    }
+    path = populate_tree.ITEMS_DIR / f"{item_id}.yaml"
+    path.write_text(yaml.dump(data))
+
+
+@pytest.fixture
+def cache_client(tmp_path: Path) -> CacheClient:
+    return CacheClient(tmp_path / "test_cache")
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    populate_tree.ITEMS_DIR.mkdir(parents=True)
+    return populate_tree.ITEMS_DIR
+
+
+@pytest.fixture
+def mocks(mocker, data_dir):
+    failing: set[int] = set()
+
+    def fake_populate(item_id, cache, **kwargs):
+        if item_id in failing:
+            raise ValueError("boom")
+        _write_item(item_id)
+
+    populate = mocker.patch("scripts.populate_tree.populate_item", side_effect=fake_populate)
+    populate.failing = failing
+    return {
+        "populate": populate,
+        "prefetch": mocker.patch("scripts.populate_tree.prefetch_extractions"),
+        "indexes": mocker.patch.object(populate_tree.api, "load_name_indexes"),
+        "bulk": mocker.patch.object(populate_tree.api, "get_items_bulk"),
+        "sound": mocker.patch("scripts.populate_tree._play_completion_sound"),
+    }
+
+
+def _populated(mocks) -> list[int]:
+    return sorted(call.args[0] for call in mocks["populate"].call_args_list)
+
+
+def test_populates_whole_tree(mocks, cache_client):
+    errors = populate_tree.populate_tree([1], cache_client, workers=2)
+
+    assert errors == []
+    assert _populated(mocks) == [1, 2, 3, 4]
+    mocks["indexes"].assert_called_once()
+
+
+def test_limit_counts_in_flight_items(mocks, cache_client):
+    populate_tree.populate_tree([1, 5, 6, 7], cache_client, limit=2, workers=4)
+
+    assert len(mocks["populate"].call_args_list) == 2
+
+
+def test_limit_stops_before_children(mocks, cache_client):
+    populate_tree.populate_tree([1], cache_client, limit=1, workers=4)
+
+    assert _populated(mocks) == [1]
+
+
+def test_errors_are_returned_and_other_items_continue(mocks, cache_client):
+    mocks["populate"].failing.add(2)
+
+    errors = populate_tree.populate_tree([1], cache_client, workers=2, show_errors=False)
+
+    assert errors == [(2, "boom")]
+    assert _populated(mocks) == [1, 2, 3]
+
+
+def test_skips_existing_items_and_traverses_their_children(mocks, data_dir, cache_client):
+    _write_item(1)
+
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    assert _populated(mocks) == [2, 3, 4]
+
+
+def test_name_indexes_not_loaded_when_everything_exists(mocks, data_dir, cache_client):
+    for item_id in (1, 2, 3, 4):
+        _write_item(item_id)
+
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    mocks["populate"].assert_not_called()
+    mocks["indexes"].assert_not_called()
+
+
+def test_multi_item_batch_prefetches_extractions(mocks, cache_client):
+    populate_tree.populate_tree([5, 6], cache_client, workers=2)
+
+    mocks["prefetch"].assert_called_once()
+    assert mocks["prefetch"].call_args.args[0] == [5, 6]
+    assert _populated(mocks) == [5, 6]
+
+
+def test_single_item_batch_skips_prefetch(mocks, cache_client):
+    populate_tree.populate_tree([5], cache_client, workers=2)
+
+    mocks["prefetch"].assert_not_called()
+
+
+def test_new_items_are_bulk_fetched(mocks, cache_client):
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    fetched = [i for call in mocks["bulk"].call_args_list for i in call.args[0]]
+    assert sorted(fetched) == [1, 2, 3, 4]
+
+
+def test_uses_one_executor_per_run(mocker, mocks, cache_client):
+    executor = mocker.patch(
+        "scripts.populate_tree.ThreadPoolExecutor", side_effect=ThreadPoolExecutor
+    )
+
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    executor.assert_called_once_with(max_workers=2)
+
+
+def test_children_index_round_trip(mocker, mocks, cache_client):
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    children = cache_client.get_item_children()
+    assert children[1][1] == {2, 3}
+    assert children[2][1] == {4}
+
+    load = mocker.spy(populate_tree.yaml_io, "load")
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    load.assert_not_called()
+    assert len(mocks["populate"].call_args_list) == 4
+
+
+def test_children_index_refreshes_changed_files(monkeypatch, mocks, cache_client):
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    monkeypatch.setitem(TREE, 3, [5])
+    _write_item(3)
+    populate_tree.populate_tree([1], cache_client, workers=2)
+
+    assert _populated(mocks) == [1, 2, 3, 4, 5]
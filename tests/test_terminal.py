@@ -54,3 +54,23 @@ def test_progress_output():
     result = output.getvalue()
     assert "[5/10]" in result
     assert "Processing item" in result
+
+
+def test_captured_returns_output_without_writing():
+    output = StringIO()
+    with patch("sys.stdout", output), terminal.captured() as captured:
+        terminal.info("first")
+        terminal.warning("second")
+
+    assert output.getvalue() == ""
+    assert "first" in captured.getvalue()
+    assert "second" in captured.getvalue()
+
+
+def test_buffered_writes_on_exit():
+    output = StringIO()
+    with patch("sys.stdout", output):
+        with terminal.buffered():
+            terminal.info("section")
+            assert output.getvalue() == ""
+        assert output.getvalue() == "section\n"
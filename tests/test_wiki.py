@@ -120,6 +120,17 @@ class TestExtractAcquisitionSections:
         assert "Used_in" in result
         assert "Upgrade recipe from Ascended to Legendary" in result
 
+    def test_strips_markup_noise(self):
+        html = (
+            "<!-- NewPP limit report -->\n<style>.a{color:red}</style>"
+            '<script type="text/javascript">var x = 1;</script>'
+            '<p>Sold<sup id="cite_ref-1" class="reference"><a href="#cite_note-1">[1]</a></sup>'
+            '   by\n\n<img alt="Karma.png" src="/images/k.png" '
+            'srcset="/images/k2.png 2x" decoding="async">vendor</p>'
+        )
+        result = wiki.extract_acquisition_sections(html)
+        assert result == '<p>Sold by <img alt="Karma.png" src="/images/k.png">vendor</p>'
+
     def test_used_in_excluded_for_single_rarity_pages(self):
         html = _make_large_html(
             [
@@ -135,6 +146,84 @@ class TestExtractAcquisitionSections:
         assert "List of recipes where this item is an ingredient" not in result
 
 
+_VARIANTS_HEADING = '<h2><span class="mw-headline" id="Variants">Variants</span></h2>'
+
+
+def _vendor_table(*rows: str) -> str:
+    header = "<tr><th>Vendor</th><th>Rarity</th><th>Cost</th></tr>"
+    return '<table class="npc sortable table">' + header + "".join(rows) + "</table>"
+
+
+class TestFilterVariantRows:
+    def test_keeps_only_matching_rarity_rows(self):
+        html = _VARIANTS_HEADING + _vendor_table(
+            '<tr><td>Asc Vendor</td><td><span class="rarity-ascended">A</span></td></tr>',
+            '<tr><td>Leg Vendor</td><td><span class="rarity-legendary">L</span></td></tr>',
+        )
+        result = wiki.filter_variant_rows(html, "Legendary")
+        assert "Leg Vendor" in result
+        assert "Asc Vendor" not in result
+        assert "<th>Vendor</th>" in result
+
+    def test_table_without_rarity_column_is_ascended(self):
+        html = _VARIANTS_HEADING + _vendor_table("<tr><td>Plain Vendor</td><td>5 Coin</td></tr>")
+        assert "Plain Vendor" not in wiki.filter_variant_rows(html, "Legendary")
+        assert "Plain Vendor" in wiki.filter_variant_rows(html, "Ascended")
+
+    def test_pages_without_variants_unchanged(self):
+        html = _vendor_table(
+            '<tr><td>Asc Vendor</td><td><span class="rarity-ascended">A</span></td></tr>'
+        )
+        assert wiki.filter_variant_rows(html, "Exotic") is html
+
+    def test_non_vendor_tables_untouched(self):
+        variants_table = (
+            '<table class="equip craftvariants sortable table">'
+            '<tr id="item1"><td>Armguards</td><td><span class="rarity-exotic">E</span></td></tr>'
+            "</table>"
+        )
+        html = _VARIANTS_HEADING + variants_table
+        assert wiki.filter_variant_rows(html, "Legendary") == html
+
+    def test_drops_contained_in_entries_for_other_rarities(self):
+        html = (
+            _VARIANTS_HEADING
+            + '<h3><span id="Contained_in">Contained in</span></h3><ul class="smw-format">'
+            + '<li>Asc Chest <span class="rarity-ascended">A</span></li>'
+            + '<li>Leg Chest <span class="rarity-legendary">L</span></li>'
+            + "<li>Plain Chest</li></ul>"
+            + '<h3><span id="Used_in">Used in</span></h3>'
+            + '<ul><li class="rarity-ascended">Gift</li></ul>'
+        )
+        result = wiki.filter_variant_rows(html, "Legendary")
+        assert "Leg Chest" in result
+        assert "Plain Chest" in result
+        assert "Asc Chest" not in result
+        assert "Gift" in result
+
+
+class TestHasAcquisitionContent:
+    @pytest.mark.parametrize(
+        "html",
+        [
+            '<h2><span class="mw-headline" id="Acquisition">Acquisition</span></h2>',
+            '<h3><span id="Contained_in">Contained in</span></h3>',
+            '<div class="recipe-box"><div class="heading">X</div></div>',
+            '<table class="npc sortable table"><tr><td>Vendor</td></tr></table>',
+        ],
+    )
+    def test_detects_acquisition_markers(self, html):
+        assert wiki.has_acquisition_content(html)
+
+    def test_lore_only_page_has_no_acquisition_content(self):
+        html = '<h2><span id="Trivia">Trivia</span></h2><p>Some lore.</p>'
+        assert not wiki.has_acquisition_content(html)
+
+    def test_unrecognized_section_counts_as_content(self):
+        html = '<h2><span class="mw-headline" id="Obtained_from">Obtained from</span></h2>'
+        assert wiki.has_acquisition_content(html)
+
+
 class TestGetHtmlLimitForModel:
     def test_haiku_limit(self):
         assert wiki.get_html_limit_for_model("haiku") == 300_000
@@ -182,10 +271,14 @@ def cache_client(tmp_path: Path) -> CacheClient:
     return CacheClient(tmp_path / "test_cache")
 
 
+def test_page_url_replaces_spaces():
+    assert wiki.page_url("Gift of Metal") == "https://wiki.guildwars2.com/wiki/Gift_of_Metal"
+
+
 def test_get_page_html_success(mocker, cache_client: CacheClient):
     mock_html = "<html><body>Test content</body></html>"
     mock_response_data = {"parse": {"text": {"*": mock_html}}}
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = mock_response_data
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -194,10 +287,23 @@ def test_get_page_html_success(mocker, cache_client: CacheClient):
     assert result == mock_html
 
 
+def test_fetch_wiki_page_requests_bare_content(mocker):
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
+    mock_get.return_value.json.return_value = {"parse": {"text": {"*": "<p>x</p>"}}}
+    mock_get.return_value.raise_for_status = lambda: None
+
+    wiki._fetch_wiki_page("Test_Page")
+
+    params = mock_get.call_args[1]["params"]
+    assert params["disableeditsection"] == "true"
+    assert params["disabletoc"] == "true"
+    assert params["disablelimitreport"] == "true"
+
+
 def test_get_page_html_caches_result(mocker, cache_client: CacheClient):
     mock_html = "<html><body>Test content</body></html>"
     mock_response_data = {"parse": {"text": {"*": mock_html}}}
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = mock_response_data
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -218,7 +324,7 @@ def test_get_page_html_empty_name(cache_client: CacheClient):
 
 def test_get_page_html_page_not_found(mocker, cache_client: CacheClient):
     mock_response_data = {"error": {"info": "The page does not exist"}}
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = mock_response_data
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -227,7 +333,7 @@ def test_get_page_html_page_not_found(mocker, cache_client: CacheClient):
 
 
 def test_get_page_html_http_error(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_response = Response(500, request=Request("GET", "http://test.com"))
     mock_get.return_value.raise_for_status.side_effect = HTTPStatusError(
         "Server error", request=mock_response.request, response=mock_response
@@ -238,7 +344,7 @@ def test_get_page_html_http_error(mocker, cache_client: CacheClient):
 
 
 def test_get_page_html_network_error(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.side_effect = RequestError("Connection timeout")
 
     with pytest.raises(WikiError, match="Network error fetching wiki page"):
@@ -246,7 +352,7 @@ def test_get_page_html_network_error(mocker, cache_client: CacheClient):
 
 
 def test_get_page_html_invalid_json(mocker, cache_client: CacheClient):
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.side_effect = ValueError("Invalid JSON")
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -256,7 +362,7 @@ def test_get_page_html_invalid_json(mocker, cache_client: CacheClient):
 
 def test_get_page_html_unexpected_format(mocker, cache_client: CacheClient):
     mock_response_data = {"unexpected": "format"}
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = mock_response_data
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -396,7 +502,7 @@ def test_get_page_html_follows_disambiguation(mocker, cache_client: CacheClient)
             mock_resp.json.return_value = {"parse": {"text": {"*": item_html}}}
         return mock_resp
 
-    mock_get = mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mock_get = mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     result = wiki.get_page_html("Mirror", cache=cache_client)
 
@@ -406,7 +512,7 @@ def test_get_page_html_follows_disambiguation(mocker, cache_client: CacheClient)
 
 def test_get_page_html_no_redirect_for_normal_page(mocker, cache_client: CacheClient):
     normal_html = "<p>Normal item page</p>"
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = {"parse": {"text": {"*": normal_html}}}
     mock_get.return_value.raise_for_status = lambda: None
 
@@ -431,7 +537,7 @@ def test_get_page_html_caches_both_names_on_redirect(mocker, cache_client: Cache
             mock_resp.json.return_value = {"parse": {"text": {"*": item_html}}}
         return mock_resp
 
-    mock_get = mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mock_get = mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     wiki.get_page_html("Mirror", cache=cache_client)
 
@@ -458,7 +564,7 @@ def test_get_page_html_follows_server_redirect(mocker, cache_client: CacheClient
             mock_resp.json.return_value = {"parse": {"text": {"*": final_html}}}
         return mock_resp
 
-    mock_get = mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mock_get = mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     result = wiki.get_page_html("Valkyrie Bearkin War Helm", cache=cache_client)
 
@@ -481,7 +587,7 @@ def test_get_page_html_caches_both_names_on_server_redirect(mocker, cache_client
             mock_resp.json.return_value = {"parse": {"text": {"*": final_html}}}
         return mock_resp
 
-    mock_get = mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mock_get = mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     wiki.get_page_html("Valkyrie Bearkin War Helm", cache=cache_client)
 
@@ -517,7 +623,7 @@ def test_get_page_html_server_redirect_chain(mocker, cache_client: CacheClient):
             mock_resp.json.return_value = {"parse": {"text": {"*": final_html}}}
         return mock_resp
 
-    mock_get = mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mock_get = mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     result = wiki.get_page_html("Start Page", cache=cache_client)
 
@@ -532,7 +638,7 @@ def test_get_page_html_redirect_depth_limit(mocker, cache_client: CacheClient):
         mock_resp.json.return_value = {"parse": {"text": {"*": _SERVER_REDIRECT_HTML}}}
         return mock_resp
 
-    mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     with pytest.raises(WikiError, match="Redirect chain exceeded max depth"):
         wiki.get_page_html("Loop Start", cache=cache_client)
@@ -554,7 +660,7 @@ def test_server_redirect_priority_over_disambiguation(mocker, cache_client: Cach
             mock_resp.json.return_value = {"parse": {"text": {"*": final_html}}}
         return mock_resp
 
-    mocker.patch("httpx.get", side_effect=mock_get_side_effect)
+    mocker.patch("gw2_data.wiki._client.get", side_effect=mock_get_side_effect)
 
     result = wiki.get_page_html("Test Page", cache=cache_client)
 
@@ -567,7 +673,7 @@ def test_get_page_html_uses_cached_redirect_target(mocker, cache_client: CacheCl
     item_html = "<p>Mirror is a crafting material...</p>"
     cache_client.set_wiki_page("Mirror (item)", item_html)
 
-    mock_get = mocker.patch("httpx.get")
+    mock_get = mocker.patch("gw2_data.wiki._client.get")
     mock_get.return_value.json.return_value = {"parse": {"text": {"*": _DISAMBIG_HTML}}}
     mock_get.return_value.raise_for_status = lambda: None
 
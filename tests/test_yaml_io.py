@@ -0,0 +1,33 @@
+"""Tests for yaml_io module — libyaml-backed load/dump helpers."""
+
+import yaml
+
+from gw2_data import yaml_io
+
+ITEM_YAML = """\
+id: 19676
+name: Gift of Metal
+acquisitions:
+- type: mystic_forge
+  outputQuantity: 1
+  guaranteed: true
+  requirements:
+  - itemId: 19684
+    quantity: 250
+"""
+
+
+class TestYamlIo:
+    def test_load_matches_safe_load(self):
+        assert yaml_io.load(ITEM_YAML) == yaml.safe_load(ITEM_YAML)
+
+    def test_dump_matches_pure_python_output(self):
+        data = yaml.safe_load(ITEM_YAML)
+        expected = yaml.dump(data, sort_keys=False, allow_unicode=True)
+        assert yaml_io.dump(data, sort_keys=False, allow_unicode=True) == expected
+
+    def test_dump_to_stream(self, tmp_path):
+        path = tmp_path / "out.yaml"
+        with path.open("w") as f:
+            yaml_io.dump({"Mystic Coin": [19976]}, f)
+        assert yaml_io.load(path.read_text()) == {"Mystic Coin": [19976]}